@@ -1,5 +1,9 @@
 import warnings
 
+from django.conf import settings
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.views import (
@@ -12,7 +16,16 @@ from drf_spectacular.views import (
 class CustomAutoSchema(AutoSchema):
     """Custom AutoSchema to add swagger_topic to tags and handle deprecated endpoints."""
 
+    # Tags derived from the view are the same for every operation of a view
+    # class, so keep them around instead of building a serializer each time.
+    _tag_cache = {}
+
     def get_tags(self):
+        view_cls = type(self.view)
+        cacheable = 'swagger_topic' not in vars(self.view)
+        if cacheable and view_cls in self._tag_cache:
+            return list(self._tag_cache[view_cls])
+
         tags = []
         try:
             if hasattr(self.view, 'get_serializer'):
@@ -35,11 +48,14 @@ class CustomAutoSchema(AutoSchema):
             tags.append(str(self.view.model._meta.verbose_name_plural).title())
         else:
             tags = super().get_tags()  # Use default drf-spectacular behavior
+            cacheable = False  # default tags are derived from the path, not the view
 
         if not tags:
             warnings.warn(f'Could not determine tags for {self.view.__class__.__name__}')
             tags = ['api']  # Fallback to default value
 
+        if cacheable:
+            self._tag_cache[view_cls] = list(tags)
         return tags
 
     def is_deprecated(self):
@@ -48,10 +64,20 @@ class CustomAutoSchema(AutoSchema):
 
 
 class AuthenticatedSpectacularAPIView(SpectacularAPIView):
-    """SpectacularAPIView that requires authentication."""
+    """SpectacularAPIView that requires authentication.
+
+    Generating the schema walks every registered view, so the rendered
+    response is cached for API_SCHEMA_CACHE_TIMEOUT seconds per client.
+    """
 
     permission_classes = [IsAuthenticated]
 
+    def get(self, request, *args, **kwargs):
+        # The timeout is read per request so that setting it to 0 turns the cache off.
+        # Vary is applied inside the cache so cached copies are keyed on the client credentials.
+        view = cache_page(settings.API_SCHEMA_CACHE_TIMEOUT)(vary_on_headers('Authorization', 'Cookie')(super().get))
+        return view(request, *args, **kwargs)
+
 
 class AuthenticatedSpectacularSwaggerView(SpectacularSwaggerView):
     """SpectacularSwaggerView that requires authentication."""
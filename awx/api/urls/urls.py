@@ -5,6 +5,7 @@ from __future__ import absolute_import, unicode_literals
 from django.urls import include, re_path
 
 from awx.api.generics import LoggedLoginView, LoggedLogoutView
+from awx.api.schema import schema_view
 from awx.api.views.root import (
     ApiRootView,
     ApiV2RootView,
@@ -143,6 +144,8 @@ v2_urls = [
     re_path(r'^bulk/host_delete/$', BulkHostDeleteView.as_view(), name='bulk_host_delete'),
     re_path(r'^bulk/job_launch/$', BulkJobLaunchView.as_view(), name='bulk_job_launch'),
     re_path(r'^receptor_addresses/', include(receptor_address_urls)),
+    # Matched ahead of the DAB api_documentation schema endpoint, so the schema is served by the cached view
+    re_path(r'^docs/schema/$', schema_view, name='schema-json'),
 ]
 
 
@@ -153,7 +156,7 @@ urlpatterns = [
     re_path(r'^(?P<version>(v2))/', include(v2_urls)),
     re_path(r'^login/$', LoggedLoginView.as_view(template_name='rest_framework/login.html', extra_context={'inside_login_context': True}), name='login'),
     re_path(r'^logout/$', LoggedLogoutView.as_view(next_page='/api/', redirect_field_name='next'), name='logout'),
-    # the docs/, schema-related endpoints used to be listed here but now exposed by DAB api_documentation app
+    # the docs/ endpoints used to be listed here but now exposed by DAB api_documentation app, except for the schema in v2_urls
 ]
 
 from awx.api.urls.debug import urls as debug_urls
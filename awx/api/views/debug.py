@@ -1,65 +1,70 @@
-from collections import OrderedDict
-
 from django.conf import settings
 
+from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from awx.api.generics import APIView
 from ansible_base.lib.utils.schema import extend_schema_if_available
 
 from awx.main.scheduler import TaskManager, DependencyManager, WorkflowManager
+from awx.main.utils.common import ScheduleTaskManager, ScheduleDependencyManager, ScheduleWorkflowManager
+
+
+DEBUG_ROOT_URLS = {
+    'task_manager': '/api/debug/task_manager/',
+    'dependency_manager': '/api/debug/dependency_manager/',
+    'workflow_manager': '/api/debug/workflow_manager/',
+}
 
 
-class TaskManagerDebugView(APIView):
+class ManagerDebugView(APIView):
+    """
+    Base for the views that trigger one of the scheduler managers.
+
+    The manager only runs inline when AWX_DISABLE_TASK_MANAGERS is set, since
+    the dispatched task would be a no-op; otherwise it is handed to the
+    dispatcher so the request does not block on a full scheduling cycle.
+    """
+
     _ignore_model_permissions = True
     exclude_from_schema = True
     permission_classes = [AllowAny]
-    prefix = 'Task'
-    resource_purpose = 'debug task manager'
+    manager_cls = None
+    schedule_cls = None
+    prefix = ''
 
-    @extend_schema_if_available(extensions={"x-ai-description": "Trigger task manager scheduling"})
+    @extend_schema_if_available(extensions={"x-ai-description": "Trigger manager scheduling"})
     def get(self, request):
-        TaskManager().schedule()
-        if not settings.AWX_DISABLE_TASK_MANAGERS:
-            msg = f"Running {self.prefix} manager. To disable other triggers to the {self.prefix} manager, set AWX_DISABLE_TASK_MANAGERS to True"
-        else:
-            msg = f"AWX_DISABLE_TASK_MANAGERS is True, this view is the only way to trigger the {self.prefix} manager"
-        return Response(msg)
+        if settings.AWX_DISABLE_TASK_MANAGERS:
+            self.manager_cls().schedule()
+            return Response(f"AWX_DISABLE_TASK_MANAGERS is True, this view is the only way to trigger the {self.prefix} manager")
+        self.schedule_cls().schedule()
+        return Response(
+            f"Scheduled {self.prefix} manager. To disable other triggers to the {self.prefix} manager, set AWX_DISABLE_TASK_MANAGERS to True",
+            status=status.HTTP_202_ACCEPTED,
+        )
 
 
-class DependencyManagerDebugView(APIView):
-    _ignore_model_permissions = True
-    exclude_from_schema = True
-    permission_classes = [AllowAny]
+class TaskManagerDebugView(ManagerDebugView):
+    manager_cls = TaskManager
+    schedule_cls = ScheduleTaskManager
+    prefix = 'Task'
+    resource_purpose = 'debug task manager'
+
+
+class DependencyManagerDebugView(ManagerDebugView):
+    manager_cls = DependencyManager
+    schedule_cls = ScheduleDependencyManager
     prefix = 'Dependency'
     resource_purpose = 'debug dependency manager'
 
-    @extend_schema_if_available(extensions={"x-ai-description": "Trigger dependency manager scheduling"})
-    def get(self, request):
-        DependencyManager().schedule()
-        if not settings.AWX_DISABLE_TASK_MANAGERS:
-            msg = f"Running {self.prefix} manager. To disable other triggers to the {self.prefix} manager, set AWX_DISABLE_TASK_MANAGERS to True"
-        else:
-            msg = f"AWX_DISABLE_TASK_MANAGERS is True, this view is the only way to trigger the {self.prefix} manager"
-        return Response(msg)
-
 
-class WorkflowManagerDebugView(APIView):
-    _ignore_model_permissions = True
-    exclude_from_schema = True
-    permission_classes = [AllowAny]
+class WorkflowManagerDebugView(ManagerDebugView):
+    manager_cls = WorkflowManager
+    schedule_cls = ScheduleWorkflowManager
     prefix = 'Workflow'
     resource_purpose = 'debug workflow manager'
 
-    @extend_schema_if_available(extensions={"x-ai-description": "Trigger workflow manager scheduling"})
-    def get(self, request):
-        WorkflowManager().schedule()
-        if not settings.AWX_DISABLE_TASK_MANAGERS:
-            msg = f"Running {self.prefix} manager. To disable other triggers to the {self.prefix} manager, set AWX_DISABLE_TASK_MANAGERS to True"
-        else:
-            msg = f"AWX_DISABLE_TASK_MANAGERS is True, this view is the only way to trigger the {self.prefix} manager"
-        return Response(msg)
-
 
 class DebugRootView(APIView):
     _ignore_model_permissions = True
@@ -70,8 +75,4 @@ class DebugRootView(APIView):
     @extend_schema_if_available(extensions={"x-ai-description": "List available debug endpoints"})
     def get(self, request, format=None):
         '''List of available debug urls'''
-        data = OrderedDict()
-        data['task_manager'] = '/api/debug/task_manager/'
-        data['dependency_manager'] = '/api/debug/dependency_manager/'
-        data['workflow_manager'] = '/api/debug/workflow_manager/'
-        return Response(data)
+        return Response(DEBUG_ROOT_URLS)
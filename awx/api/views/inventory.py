@@ -81,11 +81,11 @@ class InventoryDetail(RelatedJobsPreventDeleteMixin, RetrieveUpdateDestroyAPIVie
     resource_purpose = 'inventory detail'
 
     def update(self, request, *args, **kwargs):
-        obj = self.get_object()
         kind = self.request.data.get('kind') or kwargs.get('kind')
 
         # Do not allow changes to an Inventory kind.
-        if kind is not None and obj.kind != kind:
+        # The parent update loads the object itself, so only fetch it here when a kind was given.
+        if kind is not None and self.get_object().kind != kind:
             return Response(
                 dict(error=_('You cannot turn a regular inventory into a "smart" or "constructed" inventory.')), status=status.HTTP_405_METHOD_NOT_ALLOWED
             )
@@ -143,7 +143,12 @@ class InventoryActivityStreamList(SubListAPIView):
         parent = self.get_parent_object()
         self.check_parent_access(parent)
         qs = self.request.user.get_queryset(self.model)
-        return qs.filter(Q(inventory=parent) | Q(host__in=parent.hosts.all()) | Q(group__in=parent.groups.all()))
+        # Resolve each relation against its own through table so the outer
+        # query does not OR together three LEFT JOINs on the M2M tables
+        inventory_ids = ActivityStream.inventory.through.objects.filter(inventory=parent).values('activitystream_id')
+        host_ids = ActivityStream.host.through.objects.filter(host__inventory=parent).values('activitystream_id')
+        group_ids = ActivityStream.group.through.objects.filter(group__inventory=parent).values('activitystream_id')
+        return qs.filter(Q(pk__in=inventory_ids) | Q(pk__in=host_ids) | Q(pk__in=group_ids))
 
 
 class InventoryInstanceGroupsList(SubListAttachDetachAPIView):
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from rest_framework.fields import ValidationError
@@ -24,28 +26,29 @@ class TestStringListBooleanField:
 
     FIELD_VALUES_INVALID = [1.245, {"a": "b"}]
 
+    @pytest.fixture(scope='class')
+    @classmethod
+    def field(cls):
+        return StringListBooleanField()
+
     @pytest.mark.parametrize("value_in, value_known", FIELD_VALUES)
-    def test_to_internal_value_valid(self, value_in, value_known):
-        field = StringListBooleanField()
+    def test_to_internal_value_valid(self, field, value_in, value_known):
         v = field.to_internal_value(value_in)
         assert v == value_known
 
     @pytest.mark.parametrize("value", FIELD_VALUES_INVALID)
-    def test_to_internal_value_invalid(self, value):
-        field = StringListBooleanField()
+    def test_to_internal_value_invalid(self, field, value):
         with pytest.raises(ValidationError) as e:
             field.to_internal_value(value)
         assert e.value.detail[0] == "Expected None, True, False, a string or list of strings but got {} instead.".format(type(value))
 
     @pytest.mark.parametrize("value_in, value_known", FIELD_VALUES)
-    def test_to_representation_valid(self, value_in, value_known):
-        field = StringListBooleanField()
+    def test_to_representation_valid(self, field, value_in, value_known):
         v = field.to_representation(value_in)
         assert v == value_known
 
     @pytest.mark.parametrize("value", FIELD_VALUES_INVALID)
-    def test_to_representation_invalid(self, value):
-        field = StringListBooleanField()
+    def test_to_representation_invalid(self, field, value):
         with pytest.raises(ValidationError) as e:
             field.to_representation(value)
         assert e.value.detail[0] == "Expected None, True, False, a string or list of strings but got {} instead.".format(type(value))
@@ -56,15 +59,18 @@ class TestListTuplesField:
 
     FIELD_VALUES_INVALID = [("abc", type("abc")), ([('a', 'b', 'c'), ('abc', '123', '456')], type(('a',))), (['a', 'b'], type('a')), (123, type(123))]
 
+    @pytest.fixture(scope='class')
+    @classmethod
+    def field(cls):
+        return ListTuplesField()
+
     @pytest.mark.parametrize("value_in, value_known", FIELD_VALUES)
-    def test_to_internal_value_valid(self, value_in, value_known):
-        field = ListTuplesField()
+    def test_to_internal_value_valid(self, field, value_in, value_known):
         v = field.to_internal_value(value_in)
         assert v == value_known
 
     @pytest.mark.parametrize("value, t", FIELD_VALUES_INVALID)
-    def test_to_internal_value_invalid(self, value, t):
-        field = ListTuplesField()
+    def test_to_internal_value_invalid(self, field, value, t):
         with pytest.raises(ValidationError) as e:
             field.to_internal_value(value)
         assert e.value.detail[0] == "Expected a list of tuples of max length 2 but got {} instead.".format(t)
@@ -84,29 +90,36 @@ class TestStringListPathField:
 
     FIELD_VALUES_INVALID_PATH = ["", "~/", "home", "/invalid_path", "/home/invalid_path"]
 
+    @pytest.fixture(scope='class')
+    @classmethod
+    def field(cls):
+        return StringListPathField()
+
     @pytest.mark.parametrize("value_in, value_known", FIELD_VALUES)
-    def test_to_internal_value_valid(self, value_in, value_known):
-        field = StringListPathField()
+    def test_to_internal_value_valid(self, field, value_in, value_known):
         v = field.to_internal_value(value_in)
         assert v == value_known
 
     @pytest.mark.parametrize("value", FIELD_VALUES_INVALID_TYPE)
-    def test_to_internal_value_invalid_type(self, value):
-        field = StringListPathField()
+    def test_to_internal_value_invalid_type(self, field, value):
         with pytest.raises(ValidationError) as e:
             field.to_internal_value(value)
         assert e.value.detail[0] == "Expected list of strings but got {} instead.".format(type(value))
 
     @pytest.mark.parametrize("value", FIELD_VALUES_INVALID_PATH)
-    def test_to_internal_value_invalid_path(self, value):
-        field = StringListPathField()
+    def test_to_internal_value_invalid_path(self, field, value):
         with pytest.raises(ValidationError) as e:
             field.to_internal_value([value])
         assert e.value.detail[0] == "{} is not a valid path choice.".format(value)
 
 
 class TestURLField:
-    regex = "^https://www.example.org$"
+    regex = re.compile("^https://www.example.org$")
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def default_field(cls):
+        return URLField()
 
     @pytest.mark.parametrize(
         "url,schemes,regex, allow_numbers_in_top_level_domain, expect_no_error",
@@ -159,10 +172,9 @@ class TestURLField:
             ("https://[fe80::210:f3ff:fedf:4567%3]", True),  # ipv6 scope identifier, numerical interface
         ],
     )
-    def test_ipv6_urls(self, url, expect_error):
-        field = URLField()
+    def test_ipv6_urls(self, default_field, url, expect_error):
         if expect_error:
             with pytest.raises(ValidationError, match="Enter a valid URL"):
-                field.run_validators(url)
+                default_field.run_validators(url)
         else:
-            field.run_validators(url)
+            default_field.run_validators(url)
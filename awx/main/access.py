@@ -830,12 +830,8 @@ class InventoryAccess(BaseAccess):
     """
 
     model = Inventory
-    prefetch_related = (
-        'created_by',
-        'modified_by',
-        'organization',
-        Prefetch('labels', queryset=Label.objects.all().order_by('name')),
-    )
+    select_related = ('created_by', 'modified_by', 'organization')
+    prefetch_related = (Prefetch('labels', queryset=Label.objects.all().order_by('name')),)
 
     @check_superuser
     def can_use(self, obj):
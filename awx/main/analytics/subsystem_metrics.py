@@ -71,6 +71,10 @@ class BaseM:
         value = conn.hget(root_key, self.field)
         return self.decode_value(value)
 
+    def decode_from(self, values):
+        # same as decode, but reads from an already fetched copy of the hash
+        return self.decode_value(values.get(self.field.encode()))
+
     def to_prometheus(self, instance_data, namespace=None):
         output_text = f"# HELP {self.field} {self.help_text}\n# TYPE {self.field} gauge\n"
         for instance in instance_data:
@@ -167,6 +171,14 @@ class HistogramM(BaseM):
         values['inf'] = self.inf.decode(conn)
         return values
 
+    def decode_from(self, values):
+        decoded = {'counts': []}
+        for b in self.buckets_to_keys:
+            decoded['counts'].append(self.buckets_to_keys[b].decode_from(values))
+        decoded['sum'] = self.sum.decode_from(values)
+        decoded['inf'] = self.inf.decode_from(values)
+        return decoded
+
     def store_value(self, conn):
         for b in self.buckets:
             self.buckets_to_keys[b].store_value(conn)
@@ -267,9 +279,11 @@ class Metrics(MetricsNamespace):
 
     def load_local_metrics(self):
         # generate python dictionary of key values from metrics stored in redis
+        # read the whole hash in one round trip instead of one HGET per field
+        values = self.conn.hgetall(root_key)
         data = {}
         for field in self.METRICS:
-            data[field] = self.METRICS[field].decode(self.conn)
+            data[field] = self.METRICS[field].decode_from(values)
         return data
 
     def should_pipe_execute(self):
@@ -75,9 +75,7 @@ class MainConfig(AppConfig):
         extra_entry_point_groups = () if is_awx else ('inventory.supported',)
         entry_points = load_all_entry_points_for(['inventory', *extra_entry_point_groups])
 
-        for entry_point_name, entry_point in entry_points.items():
-            cls = entry_point.load()
-            InventorySourceOptions.injectors[entry_point_name] = cls
+        InventorySourceOptions.injectors.update({entry_point_name: entry_point.load() for entry_point_name, entry_point in entry_points.items()})
 
     def configure_dispatcherd(self):
         """This implements the default configuration for dispatcherd
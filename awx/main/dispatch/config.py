@@ -2,7 +2,7 @@ from django.conf import settings
 
 from ansible_base.lib.utils.db import get_pg_notify_params
 from awx.main.dispatch import get_task_queuename
-from awx.main.dispatch.pool import get_auto_max_workers
+from awx.main.dispatch.pool import get_auto_max_workers, get_auto_min_workers
 
 
 def get_dispatcherd_config(for_service: bool = False, mock_publish: bool = False) -> dict:
@@ -14,18 +14,21 @@ def get_dispatcherd_config(for_service: bool = False, mock_publish: bool = False
     mock_publish: if True, use mock values that don't require database access
       this is used during tests to avoid database queries during app initialization
     """
-    # When mock_publish=True (e.g., during tests), use a default value to avoid
-    # database access in get_auto_max_workers() which queries settings.IS_K8S
-    if mock_publish:
-        max_workers = 20  # Reasonable default for tests
-    else:
+    # Only the dispatcher service sizes a worker pool, every other process just publishes.
+    # get_auto_max_workers() inspects memory and CPU and queries settings.IS_K8S,
+    # so skip it for publishers and when mock_publish=True (e.g., during tests)
+    if for_service and not mock_publish:
         max_workers = get_auto_max_workers()
+        min_workers = get_auto_min_workers(max_workers)
+    else:
+        max_workers = 20  # Reasonable default, not used outside of the service
+        min_workers = 4
 
     config = {
         "version": 2,
         "service": {
             "pool_kwargs": {
-                "min_workers": settings.JOB_EVENT_WORKERS,
+                "min_workers": min_workers,
                 "max_workers": max_workers,
             },
             "main_kwargs": {"node_id": settings.CLUSTER_HOST_ID},
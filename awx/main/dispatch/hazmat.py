@@ -24,8 +24,11 @@ for name, options in settings.CELERYBEAT_SCHEDULE.items():
     resolve_callable(options['task'])
 
 
-# Preload in-line import from tasks
+# Preload in-line imports from tasks
 from awx.main.scheduler.kubernetes import PodManager  # noqa
+from awx.main.signals import disable_activity_stream  # noqa
+from awx.main.management.commands.inventory_import import Command as InventoryImportCommand  # noqa
+from awx.api.generics import CopyAPIView  # noqa
 
 
 from django.core.cache import cache as django_cache
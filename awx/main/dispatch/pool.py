@@ -364,6 +364,19 @@ def get_auto_max_workers():
     return auto_max
 
 
+def get_auto_min_workers(max_workers):
+    """Method we normally rely on to get min_workers
+
+    Uses settings.DISPATCHER_MIN_WORKERS, or half of the CPUs of this node,
+    corrected the same way as for capacity, if that is not set.
+    The pool always scales up to min_workers, so it is capped at max_workers.
+    """
+    min_workers = settings.DISPATCHER_MIN_WORKERS
+    if min_workers is None:
+        min_workers = max(4, int(get_corrected_cpu(get_cpu_count())) // 2)
+    return min(min_workers, max_workers)
+
+
 class AutoscalePool(WorkerPool):
     """
     An extended pool implementation that automatically scales workers up and
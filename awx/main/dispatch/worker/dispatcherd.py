@@ -1,5 +1,6 @@
 from dispatcherd.worker.task import TaskWorker
 
+from django.conf import settings
 from django.db import connection
 
 
@@ -7,6 +8,9 @@ class AWXTaskWorker(TaskWorker):
 
     def on_start(self) -> None:
         """Get worker connected so that first task it gets will be worked quickly"""
+        # Apply overrides specifically for worker connections
+        for k, v in settings.DISPATCHER_WORKER_DATABASES.get('default', {}).items():
+            connection.settings_dict[k] = v
         connection.ensure_connection()
 
     def pre_task(self, message) -> None:
@@ -1,32 +1,33 @@
 # Copyright (c) 2015 Ansible, Inc.
 # All Rights Reserved.
+import asyncio
 import logging
 import logging.config
 import yaml
-import copy
 
 import redis
 
 from django.conf import settings
-from django.db import connection
+from django.db import connections
 from django.core.management.base import BaseCommand, CommandError
 from django.core.cache import cache as django_cache
 
 from flags.state import flag_enabled
 
 from dispatcherd.factories import get_control_from_settings
-from dispatcherd import run_service
-from dispatcherd.config import setup as dispatcher_setup
 
-from awx.main.dispatch import get_task_queuename
-from awx.main.dispatch.config import get_dispatcherd_config
 from awx.main.dispatch.control import Control
-from awx.main.dispatch.pool import AutoscalePool
-from awx.main.dispatch.worker import AWXConsumerPG, TaskWorker
-from awx.main.analytics.subsystem_metrics import DispatcherMetricsServer
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml is not available
+    from yaml import SafeDumper
 
 logger = logging.getLogger('awx.main.dispatch')
 
+# Upper bound on cancel replies awaited at once, each holds a broker connection
+MAX_CONCURRENT_CANCELS = 10
+
 
 class Command(BaseCommand):
     help = 'Launch the task dispatcher'
@@ -52,35 +53,36 @@ class Command(BaseCommand):
         )
 
     def handle(self, *arg, **options):
+        dispatcherd_enabled = flag_enabled('FEATURE_DISPATCHERD_ENABLED')
         if options.get('status'):
-            if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+            if dispatcherd_enabled:
                 ctl = get_control_from_settings()
                 running_data = ctl.control_with_reply('status')
                 if len(running_data) != 1:
                     raise CommandError('Did not receive expected number of replies')
-                print(yaml.dump(running_data[0], default_flow_style=False))
+                print(yaml.dump(running_data[0], default_flow_style=False, Dumper=SafeDumper))
                 return
             else:
                 print(Control('dispatcher').status())
                 return
         if options.get('schedule'):
-            if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+            if dispatcherd_enabled:
                 print('NOT YET IMPLEMENTED')
                 return
             else:
                 print(Control('dispatcher').schedule())
             return
         if options.get('running'):
-            if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+            if dispatcherd_enabled:
                 ctl = get_control_from_settings()
                 running_data = ctl.control_with_reply('running')
-                print(yaml.dump(running_data, default_flow_style=False))
+                print(yaml.dump(running_data, default_flow_style=False, Dumper=SafeDumper))
                 return
             else:
                 print(Control('dispatcher').running())
                 return
         if options.get('reload'):
-            if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+            if dispatcherd_enabled:
                 print('NOT YET IMPLEMENTED')
                 return
             else:
@@ -94,29 +96,51 @@ class Command(BaseCommand):
             if not isinstance(cancel_data, list):
                 cancel_data = [cancel_str]
 
-            if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+            if dispatcherd_enabled:
                 ctl = get_control_from_settings()
-                results = []
-                for task_id in cancel_data:
-                    # For each task UUID, send an individual cancel command
-                    result = ctl.control_with_reply('cancel', data={'uuid': task_id})
-                    results.append(result)
-                print(yaml.dump(results, default_flow_style=False))
+
+                async def cancel_all():
+                    # The cancel command takes a single UUID, so send them concurrently
+                    # and wait for the replies together instead of one timeout per task.
+                    # Every call opens its own broker connection, so only a few run at once.
+                    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CANCELS)
+
+                    async def cancel(task_id):
+                        async with semaphore:
+                            return await ctl.acontrol_with_reply('cancel', data={'uuid': task_id})
+
+                    return await asyncio.gather(*(cancel(task_id) for task_id in cancel_data))
+
+                results = asyncio.run(cancel_all())
+                print(yaml.dump(results, default_flow_style=False, Dumper=SafeDumper))
                 return
             else:
                 print(Control('dispatcher').cancel(cancel_data))
                 return
 
-        if flag_enabled('FEATURE_DISPATCHERD_ENABLED'):
+        # The control options above only need a client, so the service
+        # modules are imported here to keep those invocations fast
+        if dispatcherd_enabled:
+            from dispatcherd import run_service
+            from dispatcherd.config import setup as dispatcher_setup
+
+            from awx.main.dispatch.config import get_dispatcherd_config
+
             self.configure_dispatcher_logging()
+            # Building the config reads settings, which may query the database
+            dispatcher_setup(get_dispatcherd_config(for_service=True))
 
-            # Close the connection, because the pg_notify broker will create new async connection
-            connection.close()
+            # Close the connections last, because the pg_notify broker will create new async connection
+            connections.close_all()
             django_cache.close()
 
-            dispatcher_setup(get_dispatcherd_config(for_service=True))
             run_service()
         else:
+            from awx.main.analytics.subsystem_metrics import DispatcherMetricsServer
+            from awx.main.dispatch import get_task_queuename
+            from awx.main.dispatch.pool import AutoscalePool, get_auto_max_workers, get_auto_min_workers
+            from awx.main.dispatch.worker import AWXConsumerPG, TaskWorker
+
             consumer = None
 
             try:
@@ -126,7 +150,9 @@ class Command(BaseCommand):
 
             try:
                 queues = ['tower_broadcast_all', 'tower_settings_change', get_task_queuename()]
-                consumer = AWXConsumerPG('dispatcher', TaskWorker(), queues, AutoscalePool(min_workers=4), schedule=settings.CELERYBEAT_SCHEDULE)
+                max_workers = get_auto_max_workers()
+                pool = AutoscalePool(min_workers=get_auto_min_workers(max_workers), max_workers=max_workers)
+                consumer = AWXConsumerPG('dispatcher', TaskWorker(), queues, pool, schedule=settings.CELERYBEAT_SCHEDULE)
                 consumer.run()
             except KeyboardInterrupt:
                 logger.debug('Terminating Task Dispatcher')
@@ -135,15 +161,20 @@ class Command(BaseCommand):
 
     def configure_dispatcher_logging(self):
         # Apply special log rule for the parent process
-        special_logging = copy.deepcopy(settings.LOGGING)
-        for handler_name, handler_config in special_logging.get('handlers', {}).items():
+        # Only handlers and the dispatcherd logger change, so copy just those
+        # entries rather than deep copying all of settings.LOGGING
+        special_logging = dict(settings.LOGGING)
+        handlers = dict(special_logging.get('handlers', {}))
+        for handler_name, handler_config in handlers.items():
             filters = handler_config.get('filters', [])
             if 'dynamic_level_filter' in filters:
-                handler_config['filters'] = [flt for flt in filters if flt != 'dynamic_level_filter']
+                handlers[handler_name] = dict(handler_config, filters=[flt for flt in filters if flt != 'dynamic_level_filter'])
                 logger.info(f'Dispatcherd main process replaced log level filter for {handler_name} handler')
+        special_logging['handlers'] = handlers
 
         # Apply the custom logging level here, before the asyncio code starts
-        special_logging.setdefault('loggers', {}).setdefault('dispatcherd', {})
-        special_logging['loggers']['dispatcherd']['level'] = settings.LOG_AGGREGATOR_LEVEL
+        loggers = dict(special_logging.get('loggers', {}))
+        loggers['dispatcherd'] = dict(loggers.get('dispatcherd', {}), level=settings.LOG_AGGREGATOR_LEVEL)
+        special_logging['loggers'] = loggers
 
         logging.config.dictConfig(special_logging)
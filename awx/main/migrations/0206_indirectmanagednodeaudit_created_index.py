@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0205_alter_instance_peers_alter_job_hosts_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='indirectmanagednodeaudit',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -20,7 +20,6 @@ def create_clearsessions_jt(apps, schema_editor):
     ContentType = apps.get_model('contenttypes', 'ContentType')
     sjt_ct = ContentType.objects.get_for_model(SystemJobTemplate)
     now_dt = now()
-    schedule_time = now_dt.strftime('%Y%m%dT%H%M%SZ')
 
     sjt, created = SystemJobTemplate.objects.get_or_create(
         job_type='cleanup_sessions',
@@ -33,9 +32,10 @@ def create_clearsessions_jt(apps, schema_editor):
         ),
     )
     if created:
+        schedule_time = now_dt.strftime('%Y%m%dT%H%M%SZ')
         sched = Schedule(
             name='Cleanup Expired Sessions',
-            rrule='DTSTART:%s RRULE:FREQ=WEEKLY;INTERVAL=1' % schedule_time,
+            rrule=f'DTSTART:{schedule_time} RRULE:FREQ=WEEKLY;INTERVAL=1',
             description='Cleans out expired browser sessions',
             enabled=True,
             created=now_dt,
@@ -48,6 +48,8 @@ def create_clearsessions_jt(apps, schema_editor):
 
 def delete_clear_tokens_sjt(apps, schema_editor):
     SystemJobTemplate = apps.get_model('main', 'SystemJobTemplate')
-    for sjt in SystemJobTemplate.objects.filter(job_type='cleanup_tokens'):
-        logger.info(f'Deleting system job template id={sjt.id} due to removal of local OAuth2 tokens')
-        sjt.delete()
+    qs = SystemJobTemplate.objects.filter(job_type='cleanup_tokens')
+    sjt_ids = list(qs.values_list('id', flat=True))
+    if sjt_ids:
+        logger.info(f'Deleting system job templates ids={sjt_ids} due to removal of local OAuth2 tokens')
+        qs.delete()
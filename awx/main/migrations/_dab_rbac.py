@@ -73,8 +73,9 @@ def build_role_map(apps):
     all_fields.add(system_admin)
     all_fields.add(system_auditor)
 
+    # inherited role fields are the same field objects as on the parent model, which is also in models
     for cls in models:
-        for f in cls._meta.get_fields():
+        for f in cls._meta.local_fields:
             if isinstance(f, ImplicitRoleField):
                 all_fields.add(f)
 
@@ -106,50 +107,86 @@ def build_role_map(apps):
     return (parents, children)
 
 
-def get_descendents(f, children_map):
+def get_descendents(f, children_map, cache=None):
     """
     Given ImplicitRoleField F and the children mapping, returns all descendents
     of that field, as a set of other fields, including itself
+    If a cache dict is given, results are memoized in it, which is valid as long
+    as the same children mapping is used
     """
+    if cache is not None and f in cache:
+        return cache[f]
     ret = {f}
     if f in children_map:
         for child_field in children_map[f]:
-            ret.update(get_descendents(child_field, children_map))
+            ret.update(get_descendents(child_field, children_map, cache=cache))
+    if cache is not None:
+        cache[f] = ret
     return ret
 
 
-def get_permissions_for_role(role_field, children_map, apps):
-    Permission = apps.get_model('dab_rbac', 'DABPermission')
-    try:
-        # After migration for remote permissions
-        ContentType = apps.get_model('dab_rbac', 'DABContentType')
-    except LookupError:
-        # If using DAB from before remote permissions are implemented
-        ContentType = apps.get_model('contenttypes', 'ContentType')
+class PermissionIndex:
+    """
+    All DABPermission entries loaded in one query and bucketed by content type,
+    so resolving the permissions of many roles does not query per permission
+    """
+
+    def __init__(self, apps):
+        Permission = apps.get_model('dab_rbac', 'DABPermission')
+        try:
+            # After migration for remote permissions
+            self.ContentType = apps.get_model('dab_rbac', 'DABContentType')
+        except LookupError:
+            # If using DAB from before remote permissions are implemented
+            self.ContentType = apps.get_model('contenttypes', 'ContentType')
+
+        self.by_content_type = defaultdict(list)
+        self.by_codename = {}
+        for perm in Permission.objects.order_by('pk'):
+            self.by_content_type[perm.content_type_id].append(perm)
+            self.by_codename[perm.codename] = perm
+        self.content_type_ids = {}
+
+    def for_model(self, model):
+        if model not in self.content_type_ids:
+            self.content_type_ids[model] = self.ContentType.objects.get_for_model(model).id
+        return self.by_content_type[self.content_type_ids[model]]
+
+    def first(self, model, prefix):
+        for perm in self.for_model(model):
+            if perm.codename.startswith(prefix):
+                return perm
+        return None
+
 
-    perm_list = []
-    for child_field in get_descendents(role_field, children_map):
+def get_permissions_for_role(role_field, children_map, apps, perm_index=None, descendent_cache=None):
+    if perm_index is None:
+        perm_index = PermissionIndex(apps)
+
+    perms = {}  # keyed by id, ordered by insertion
+    for child_field in get_descendents(role_field, children_map, cache=descendent_cache):
         if child_field.name in role_name_to_perm_mapping:
             for perm_name in role_name_to_perm_mapping[child_field.name]:
                 if perm_name == 'add_' and role_field.model._meta.model_name != 'organization':
                     continue  # only organizations can contain add permissions
-                perm = Permission.objects.filter(content_type=ContentType.objects.get_for_model(child_field.model), codename__startswith=perm_name).first()
-                if perm is not None and perm not in perm_list:
-                    perm_list.append(perm)
+                perm = perm_index.first(child_field.model, perm_name)
+                if perm is not None:
+                    perms.setdefault(perm.id, perm)
 
     # special case for two models that have object roles but no organization roles in old system
     if role_field.name == 'notification_admin_role' or (role_field.name == 'admin_role' and role_field.model._meta.model_name == 'organization'):
-        ct = ContentType.objects.get_for_model(apps.get_model('main', 'NotificationTemplate'))
-        perm_list.extend(list(Permission.objects.filter(content_type=ct)))
+        for perm in perm_index.for_model(apps.get_model('main', 'NotificationTemplate')):
+            perms.setdefault(perm.id, perm)
     if role_field.name == 'execution_environment_admin_role' or (role_field.name == 'admin_role' and role_field.model._meta.model_name == 'organization'):
-        ct = ContentType.objects.get_for_model(apps.get_model('main', 'ExecutionEnvironment'))
-        perm_list.extend(list(Permission.objects.filter(content_type=ct)))
+        for perm in perm_index.for_model(apps.get_model('main', 'ExecutionEnvironment')):
+            perms.setdefault(perm.id, perm)
 
     # more special cases for those same above special org-level roles
     if role_field.name == 'auditor_role':
-        perm_list.append(Permission.objects.get(codename='view_notificationtemplate'))
+        perm = perm_index.by_codename['view_notificationtemplate']
+        perms.setdefault(perm.id, perm)
 
-    return perm_list
+    return list(perms.values())
 
 
 def model_class(ct, apps):
@@ -190,18 +227,18 @@ def migrate_to_new_rbac(apps, schema_editor):
 
     # Build map of old role model
     parents, children = build_role_map(apps)
+    perm_index = PermissionIndex(apps)
+    descendent_cache = {}
 
     # NOTE: this import is expected to break at some point, and then just move the data here
     from awx.main.models.rbac import role_descriptions
 
-    for role in Role.objects.prefetch_related('members', 'parents').iterator(chunk_size=1000):
+    for role in Role.objects.select_related('content_type').prefetch_related('members', 'parents').iterator(chunk_size=1000):
         if role.singleton_name:
             continue  # only bothering to migrate object roles
 
-        team_roles = []
-        for parent in role.parents.all():
-            if parent.id not in json.loads(role.implicit_parents):
-                team_roles.append(parent)
+        implicit_parent_ids = set(json.loads(role.implicit_parents))
+        team_roles = [parent for parent in role.parents.all() if parent.id not in implicit_parent_ids]
 
         # we will not create any roles that do not have any users or teams
         if not (role.members.all() or team_roles):
@@ -210,9 +247,8 @@ def migrate_to_new_rbac(apps, schema_editor):
 
         # get a list of permissions that the old role would grant
         object_cls = apps.get_model(f'main.{role.content_type.model}')
-        object = object_cls.objects.get(pk=role.object_id)  # WORKAROUND, role.content_object does not work in migrations
-        f = object._meta.get_field(role.role_field)  # should be ImplicitRoleField
-        perm_list = get_permissions_for_role(f, children, apps)
+        f = object_cls._meta.get_field(role.role_field)  # should be ImplicitRoleField
+        perm_list = get_permissions_for_role(f, children, apps, perm_index=perm_index, descendent_cache=descendent_cache)
 
         permissions = frozenset(perm.id for perm in perm_list)
 
@@ -268,26 +304,42 @@ def migrate_to_new_rbac(apps, schema_editor):
     old_system_auditor = Role.objects.filter(singleton_name='system_auditor').first()
     if old_system_auditor:
         # if the system auditor role is not present, this is a new install and no users should exist
-        ct = 0
-        for user in role.members.all():
-            RoleUserAssignment.objects.create(user=user, role_definition=new_system_auditor)
-            ct += 1
-        if ct:
-            logger.info(f'Migrated {ct} users to new system auditor flag')
+        assignments = [RoleUserAssignment(user=user, role_definition=new_system_auditor) for user in old_system_auditor.members.all()]
+        if assignments:
+            RoleUserAssignment.objects.bulk_create(assignments, batch_size=1000)
+            logger.info(f'Migrated {len(assignments)} users to new system auditor flag')
 
 
-def get_or_create_managed(name, description, ct, permissions, RoleDefinition):
-    role_definition, created = RoleDefinition.objects.get_or_create(name=name, defaults={'managed': True, 'description': description, 'content_type': ct})
-    role_definition.permissions.set(list(permissions))
+def get_or_create_managed(definitions, RoleDefinition):
+    """
+    Given a list of (name, description, content type, permissions) for the managed role definitions,
+    creates any that are missing in bulk, then syncs the managed flag and permissions of all of them
+    """
+    role_definitions = RoleDefinition.objects.in_bulk([name for name, _, _, _ in definitions], field_name='name')
 
-    if not role_definition.managed:
-        role_definition.managed = True
-        role_definition.save(update_fields=['managed'])
+    to_create = {}
+    for name, description, ct, permissions in definitions:
+        if name not in role_definitions and name not in to_create:
+            to_create[name] = RoleDefinition(name=name, managed=True, description=description, content_type=ct)
 
-    if created:
-        logger.info(f'Created RoleDefinition {role_definition.name} pk={role_definition} with {len(permissions)} permissions')
+    not_managed = [role_definition.pk for role_definition in role_definitions.values() if not role_definition.managed]
+    if not_managed:
+        RoleDefinition.objects.filter(pk__in=not_managed).update(managed=True)
 
-    return role_definition
+    for role_definition in RoleDefinition.objects.bulk_create(list(to_create.values())):
+        role_definitions[role_definition.name] = role_definition
+
+    ret = []
+    for name, description, ct, permissions in definitions:
+        role_definition = role_definitions[name]
+        role_definition.permissions.set(list(permissions))
+
+        if name in to_create:
+            logger.info(f'Created RoleDefinition {role_definition.name} pk={role_definition} with {len(permissions)} permissions')
+
+        ret.append(role_definition)
+
+    return ret
 
 
 def setup_managed_role_definitions(apps, schema_editor):
@@ -302,24 +354,19 @@ def setup_managed_role_definitions(apps, schema_editor):
         'special': '{cls.__name__} {action}',
     }
 
-    try:
-        # After migration for remote permissions
-        ContentType = apps.get_model('dab_rbac', 'DABContentType')
-    except LookupError:
-        # If using DAB from before remote permissions are implemented
-        ContentType = apps.get_model('contenttypes', 'ContentType')
+    perm_index = PermissionIndex(apps)
+    ContentType = perm_index.ContentType
 
-    Permission = apps.get_model('dab_rbac', 'DABPermission')
     RoleDefinition = apps.get_model('dab_rbac', 'RoleDefinition')
     Organization = apps.get_model(settings.ANSIBLE_BASE_ORGANIZATION_MODEL)
     org_ct = ContentType.objects.get_for_model(Organization)
-    managed_role_definitions = []
+    managed_definitions = []
 
     org_perms = set()
     for cls in permission_registry.all_registered_models:
         ct = ContentType.objects.get_for_model(cls)
         cls_name = cls._meta.model_name
-        object_perms = set(Permission.objects.filter(content_type=ct))
+        object_perms = set(perm_index.by_content_type[ct.id])
         # Special case for InstanceGroup which has an organiation field, but is not an organization child object
         if cls_name != 'instancegroup':
             org_perms.update(object_perms)
@@ -331,23 +378,20 @@ def setup_managed_role_definitions(apps, schema_editor):
                 for perm in add_perms:
                     indiv_perms.remove(perm)
 
-            managed_role_definitions.append(
-                get_or_create_managed(
-                    to_create['object_admin'].format(cls=cls), f'Has all permissions to a single {cls._meta.verbose_name}', ct, indiv_perms, RoleDefinition
-                )
+            managed_definitions.append(
+                (to_create['object_admin'].format(cls=cls), f'Has all permissions to a single {cls._meta.verbose_name}', ct, indiv_perms)
             )
 
         if 'org_children' in to_create and (cls_name not in ('organization', 'instancegroup', 'team')):
             org_child_perms = object_perms.copy()
-            org_child_perms.add(Permission.objects.get(codename='view_organization'))
+            org_child_perms.add(perm_index.by_codename['view_organization'])
 
-            managed_role_definitions.append(
-                get_or_create_managed(
+            managed_definitions.append(
+                (
                     to_create['org_children'].format(cls=cls),
                     f'Has all permissions to {cls._meta.verbose_name_plural} within an organization',
                     org_ct,
                     org_child_perms,
-                    RoleDefinition,
                 )
             )
 
@@ -359,7 +403,7 @@ def setup_managed_role_definitions(apps, schema_editor):
                     special_perms.append(perm)
             for perm in special_perms:
                 action = perm.codename.split('_')[0]
-                view_perm = Permission.objects.get(content_type=ct, codename__startswith='view_')
+                view_perm = next(other_perm for other_perm in object_perms if other_perm.codename.startswith('view_'))
                 perm_list = [perm, view_perm]
                 # Handle special-case where adhoc role also listed use permission
                 if action == 'adhoc':
@@ -367,62 +411,59 @@ def setup_managed_role_definitions(apps, schema_editor):
                         if other_perm.codename == 'use_inventory':
                             perm_list.append(other_perm)
                             break
-                managed_role_definitions.append(
-                    get_or_create_managed(
+                managed_definitions.append(
+                    (
                         to_create['special'].format(cls=cls, action=action.title()),
                         f'Has {action} permissions to a single {cls._meta.verbose_name}',
                         ct,
                         perm_list,
-                        RoleDefinition,
                     )
                 )
 
     if 'org_admin' in to_create:
-        managed_role_definitions.append(
-            get_or_create_managed(
+        managed_definitions.append(
+            (
                 to_create['org_admin'].format(cls=Organization),
                 'Has all permissions to a single organization and all objects inside of it',
                 org_ct,
                 org_perms,
-                RoleDefinition,
             )
         )
 
     # Special "organization action" roles
     audit_permissions = [perm for perm in org_perms if perm.codename.startswith('view_')]
-    audit_permissions.append(Permission.objects.get(codename='audit_organization'))
-    managed_role_definitions.append(
-        get_or_create_managed(
+    audit_permissions.append(perm_index.by_codename['audit_organization'])
+    managed_definitions.append(
+        (
             'Organization Audit',
             'Has permission to view all objects inside of a single organization',
             org_ct,
             audit_permissions,
-            RoleDefinition,
         )
     )
 
     org_execute_permissions = {'view_jobtemplate', 'execute_jobtemplate', 'view_workflowjobtemplate', 'execute_workflowjobtemplate', 'view_organization'}
-    managed_role_definitions.append(
-        get_or_create_managed(
+    managed_definitions.append(
+        (
             'Organization Execute',
             'Has permission to execute all runnable objects in the organization',
             org_ct,
             [perm for perm in org_perms if perm.codename in org_execute_permissions],
-            RoleDefinition,
         )
     )
 
     org_approval_permissions = {'view_organization', 'view_workflowjobtemplate', 'approve_workflowjobtemplate'}
-    managed_role_definitions.append(
-        get_or_create_managed(
+    managed_definitions.append(
+        (
             'Organization Approval',
             'Has permission to approve any workflow steps within a single organization',
             org_ct,
             [perm for perm in org_perms if perm.codename in org_approval_permissions],
-            RoleDefinition,
         )
     )
 
+    managed_role_definitions = get_or_create_managed(managed_definitions, RoleDefinition)
+
     unexpected_role_definitions = RoleDefinition.objects.filter(managed=True).exclude(pk__in=[rd.pk for rd in managed_role_definitions])
     for role_definition in unexpected_role_definitions:
         logger.info(f'Deleting old managed role definition {role_definition.name}, pk={role_definition.pk}')
@@ -438,60 +479,61 @@ def get_team_to_team_relationships(apps, team_member_role):
 
     # Find all team assignments with the Team Member role
     RoleTeamAssignment = apps.get_model('dab_rbac', 'RoleTeamAssignment')
-    team_assignments = RoleTeamAssignment.objects.filter(role_definition=team_member_role).select_related('team')
+    team_assignments = RoleTeamAssignment.objects.filter(role_definition=team_member_role).values_list('object_id', 'team_id')
 
-    for assignment in team_assignments:
-        parent_team_id = int(assignment.object_id)
-        child_team_id = assignment.team.id
-        team_to_team_relationships[parent_team_id].append(child_team_id)
+    for object_id, child_team_id in team_assignments:
+        team_to_team_relationships[int(object_id)].append(child_team_id)
 
     return team_to_team_relationships
 
 
-def get_all_user_members_of_team(apps, team_member_role, team_id, team_to_team_map, visited=None):
+def get_direct_user_members_of_teams(apps, team_member_role):
     """
-    Recursively find all users who are members of a team, including through nested teams.
+    Find all users directly assigned the Team Member role.
+    Returns a dict mapping team_id -> {user_id, ...}
     """
-    if visited is None:
-        visited = set()
+    direct_user_members = defaultdict(set)
+
+    RoleUserAssignment = apps.get_model('dab_rbac', 'RoleUserAssignment')
+    user_assignments = RoleUserAssignment.objects.filter(role_definition=team_member_role).values_list('object_id', 'user_id')
 
-    if team_id in visited:
-        return set()  # Avoid infinite recursion
+    for object_id, user_id in user_assignments:
+        direct_user_members[int(object_id)].add(user_id)
 
-    visited.add(team_id)
-    all_users = set()
+    return direct_user_members
 
-    # Get direct user assignments to this team
-    RoleUserAssignment = apps.get_model('dab_rbac', 'RoleUserAssignment')
-    user_assignments = RoleUserAssignment.objects.filter(role_definition=team_member_role, object_id=team_id).select_related('user')
 
-    for assignment in user_assignments:
-        all_users.add(assignment.user)
+def get_all_user_members_of_team(team_id, team_to_team_map, direct_user_members):
+    """
+    Find the ids of all users who are members of a team, including through nested teams.
+    """
+    visited = set()
+    all_user_ids = set()
+    to_visit = [team_id]
+
+    while to_visit:
+        current_team_id = to_visit.pop()
+        if current_team_id in visited:
+            continue  # Avoid infinite loops
+        visited.add(current_team_id)
 
-    # Get team-to-team assignments and recursively find their users
-    child_team_ids = team_to_team_map.get(team_id, [])
-    for child_team_id in child_team_ids:
-        nested_users = get_all_user_members_of_team(apps, team_member_role, child_team_id, team_to_team_map, visited.copy())
-        all_users.update(nested_users)
+        all_user_ids.update(direct_user_members.get(current_team_id, ()))
+        to_visit.extend(team_to_team_map.get(current_team_id, []))
 
-    return all_users
+    return all_user_ids
 
 
-def remove_team_to_team_assignment(apps, team_member_role, parent_team_id, child_team_id):
+def remove_team_to_team_assignments(apps, team_member_role, parent_team, child_team_ids):
     """
-    Remove team-to-team memberships.
+    Remove team-to-team memberships of the given child teams in the parent team.
     """
-    Team = apps.get_model('main', 'Team')
     RoleTeamAssignment = apps.get_model('dab_rbac', 'RoleTeamAssignment')
 
-    parent_team = Team.objects.get(id=parent_team_id)
-    child_team = Team.objects.get(id=child_team_id)
-
     # Remove all team-to-team RoleTeamAssignments
-    RoleTeamAssignment.objects.filter(role_definition=team_member_role, object_id=parent_team_id, team=child_team).delete()
+    RoleTeamAssignment.objects.filter(role_definition=team_member_role, object_id=parent_team.id, team_id__in=child_team_ids).delete()
 
     # Check mirroring Team model for children under member_role
-    parent_team.member_role.children.filter(object_id=child_team_id).delete()
+    parent_team.member_role.children.filter(object_id__in=child_team_ids).delete()
 
 
 def consolidate_indirect_user_roles(apps, schema_editor):
@@ -505,6 +547,7 @@ def consolidate_indirect_user_roles(apps, schema_editor):
     # get models for membership on teams
     RoleDefinition = apps.get_model('dab_rbac', 'RoleDefinition')
     Team = apps.get_model('main', 'Team')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
 
     team_member_role = RoleDefinition.objects.get(name='Team Member')
 
@@ -523,19 +566,21 @@ def consolidate_indirect_user_roles(apps, schema_editor):
         ContentType = apps.get_model('contenttypes', 'ContentType')
         team_content_type = ContentType.objects.get_for_model(Team)
 
+    direct_user_members = get_direct_user_members_of_teams(apps, team_member_role)
+    parent_teams = Team.objects.select_related('member_role').in_bulk(list(team_to_team_map.keys()))
+
     # Get all users who should be direct members of a team
     for parent_team_id, child_team_ids in team_to_team_map.items():
-        all_users = get_all_user_members_of_team(apps, team_member_role, parent_team_id, team_to_team_map)
+        all_user_ids = get_all_user_members_of_team(parent_team_id, team_to_team_map, direct_user_members)
 
         # Create direct RoleUserAssignments for all users
-        if all_users:
-            give_permissions(apps=apps, rd=team_member_role, users=list(all_users), object_id=parent_team_id, content_type_id=team_content_type.id)
+        if all_user_ids:
+            users = list(User.objects.filter(id__in=all_user_ids).only('id'))
+            give_permissions(apps=apps, rd=team_member_role, users=users, object_id=parent_team_id, content_type_id=team_content_type.id)
 
         # Mirror assignments to Team model
-        parent_team = Team.objects.get(id=parent_team_id)
-        for user in all_users:
-            parent_team.member_role.members.add(user.id)
+        parent_team = parent_teams[parent_team_id]
+        parent_team.member_role.members.add(*all_user_ids)
 
         # Remove all team-to-team assignments for parent team
-        for child_team_id in child_team_ids:
-            remove_team_to_team_assignment(apps, team_member_role, parent_team_id, child_team_id)
+        remove_team_to_team_assignments(apps, team_member_role, parent_team, child_team_ids)
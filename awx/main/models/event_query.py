@@ -1,4 +1,3 @@
-from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -18,11 +17,3 @@ class EventQuery(BaseModel):
     fqcn = models.CharField(max_length=255, help_text=_('Fully-qualified collection name.'))
     collection_version = models.CharField(max_length=32, help_text=_('Version of the collection this data applies to.'))
     event_query = models.JSONField(default=dict, help_text=_('The extensions/audit/event_query.yml file content scraped from the collection.'))
-
-    def validate_unique(self, exclude=None):
-        try:
-            EventQuery.objects.get(fqcn=self.fqcn, collection_version=self.collection_version)
-        except EventQuery.DoesNotExist:
-            return
-
-        raise ValidationError(f'an event query for collection {self.fqcn}, version {self.collection_version} already exists')
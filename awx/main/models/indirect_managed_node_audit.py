@@ -16,7 +16,7 @@ class IndirectManagedNodeAudit(BaseModel):
         app_label = 'main'
         unique_together = [('name', 'job')]
 
-    created = DateTimeField(auto_now_add=True)
+    created = DateTimeField(auto_now_add=True, db_index=True)
 
     job = ForeignKey(
         'Job',
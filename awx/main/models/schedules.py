@@ -1,7 +1,9 @@
 # Copyright (c) 2015 Ansible, Inc.
 # All Rights Reserved.
 
+import copy
 import datetime
+import functools
 import logging
 import re
 
@@ -30,16 +32,21 @@ logger = logging.getLogger('awx.main.models.schedule')
 __all__ = ['Schedule']
 
 
-UTC_TIMEZONES = {x: tzutc() for x in dateutil.parser.parserinfo().UTCZONE}
+_UTC_SINGLETON = tzutc()
+UTC_TIMEZONES = dict.fromkeys(dateutil.parser.parserinfo.UTCZONE, _UTC_SINGLETON)
+
+DTSTART_RE = re.compile(r'^.*(DTSTART[^\s]+)\s.*$')
+WHITESPACE_RE = re.compile(r'\s+')
+UNTIL_RE = re.compile(r".*?(?P<until>UNTIL\=[0-9]+T[0-9]+)(?P<utcflag>Z?)")
+DTSTART_TZID_RE = re.compile(r'DTSTART(?:;TZID=([^:;\s]+))?[:;]')
 
 
 def _assert_timezone_id_is_valid(rrules) -> None:
-    broken_rrules = [str(rrule) for rrule in rrules if rrule._dtstart and rrule._dtstart.tzinfo is None]
-    if not broken_rrules:
-        return
-    raise ValueError(
-        f'A valid TZID must be provided (e.g., America/New_York). Invalid: {broken_rrules}',
-    ) from None
+    for rrule in rrules:
+        if rrule._dtstart and rrule._dtstart.tzinfo is None:
+            raise ValueError(
+                f'A valid TZID must be provided (e.g., America/New_York). Invalid: {str(rrule)!r}',
+            ) from None
 
 
 def _fast_forward_rrules(rrules, ref_dt=None):
@@ -57,9 +64,8 @@ def _fast_forward_rrule(rrule, ref_dt=None):
     The operation ensures that the original occurrences (based on the original dtstart)
     will match the occurrences after changing the dtstart.
 
-    All datetime operations (subtracting dates and adding timedeltas) should be
-    in UTC to avoid DST issues. As such, the rrule dtstart is converted to UTC
-    then back to the original timezone at the end.
+    All arithmetic is done on POSIX timestamps, which are UTC, to avoid DST
+    issues. The new dtstart is converted back to the original timezone at the end.
 
     Returns a new rrule with a new dtstart
     '''
@@ -73,10 +79,9 @@ def _fast_forward_rrule(rrule, ref_dt=None):
     if ref_dt is None:
         ref_dt = now()
 
-    ref_dt = ref_dt.astimezone(datetime.timezone.utc)
-
-    rrule_dtstart_utc = rrule._dtstart.astimezone(datetime.timezone.utc)
-    if rrule_dtstart_utc > ref_dt:
+    ref_ts = ref_dt.timestamp()
+    rrule_dtstart_ts = rrule._dtstart.timestamp()
+    if rrule_dtstart_ts > ref_ts:
         return rrule
 
     interval = rrule._interval if rrule._interval else 1
@@ -90,18 +95,165 @@ def _fast_forward_rrule(rrule, ref_dt=None):
     if isinstance(interval, float) and not interval.is_integer():
         return rrule
 
-    seconds_since_dtstart = (ref_dt - rrule_dtstart_utc).total_seconds()
+    seconds_since_dtstart = ref_ts - rrule_dtstart_ts
 
     # it is important to fast forward by a number that is divisible by
     # interval. For example, if interval is 7 hours, we fast forward by 7, 14, 21, etc. hours.
     # Otherwise, the occurrences after the fast forward might not match the ones before.
     # x // y is integer division, lopping off any remainder, so that we get the outcome we want.
-    interval_aligned_offset = datetime.timedelta(seconds=(seconds_since_dtstart // interval) * interval)
-    new_start = rrule_dtstart_utc + interval_aligned_offset
+    interval_aligned_offset = (seconds_since_dtstart // interval) * interval
+    new_start = datetime.datetime.fromtimestamp(rrule_dtstart_ts + interval_aligned_offset, tz=datetime.timezone.utc)
     new_rrule = rrule.replace(dtstart=new_start.astimezone(rrule._dtstart.tzinfo))
     return new_rrule
 
 
+# Rules that dateutil steps through by a fixed wall clock distance when no BY* parts are given
+_FIXED_STEP_FREQS = {
+    dateutil.rrule.WEEKLY: 'weeks',
+    dateutil.rrule.DAILY: 'days',
+    dateutil.rrule.HOURLY: 'hours',
+    dateutil.rrule.MINUTELY: 'minutes',
+}
+
+
+def _is_fixed_step_rrule(rrule):
+    if rrule._freq not in _FIXED_STEP_FREQS:
+        return False
+    if rrule._until and rrule._count:
+        return False
+    # _original_rule only holds BY* parts given by the user, defaults derived from dtstart are stored as None
+    return all(value is None for value in rrule._original_rule.values())
+
+
+def _rrule_step(rrule):
+    return datetime.timedelta(**{_FIXED_STEP_FREQS[rrule._freq]: rrule._interval})
+
+
+def _next_existing_occurrence(ruleset, dt):
+    '''
+    Find the first occurrence after dt that is not imaginary, like 2:30 on DST boundaries.
+
+    A lone fixed step rule is stepped forward in wall clock time instead of asking
+    the ruleset again, which would iterate from dtstart all over.
+    '''
+    if len(ruleset._rrule) != 1 or ruleset._exrule or ruleset._rdate or ruleset._exdate:
+        return ruleset.after(dt)
+    rrule = ruleset._rrule[0]
+    if rrule._count or not _is_fixed_step_rrule(rrule):
+        return ruleset.after(dt)
+
+    step = _rrule_step(rrule)
+    while True:
+        dt = (dt.replace(tzinfo=None) + step).replace(tzinfo=dt.tzinfo)
+        if rrule._until and dt > rrule._until:
+            return None
+        if datetime_exists(dt):
+            return dt
+
+
+def _last_occurrence(rrule):
+    '''
+    Compute the final occurrence of a fixed step rrule without iterating over
+    every occurrence from dtstart, returns None if the rule never occurs.
+
+    dateutil steps in wall clock time but compares against UNTIL as an aware
+    datetime, so candidates are built the same way and nudged across any DST gap.
+    '''
+    step = _rrule_step(rrule)
+    tzinfo = rrule._dtstart.tzinfo
+    naive_start = rrule._dtstart.replace(tzinfo=None)
+
+    def occurrence(n):
+        return (naive_start + n * step).replace(tzinfo=tzinfo)
+
+    if rrule._count:
+        return occurrence(rrule._count - 1)
+
+    until = rrule._until
+    if rrule._dtstart > until:
+        return None
+    naive_until = until.astimezone(tzinfo).replace(tzinfo=None) if tzinfo else until
+    n = max((naive_until - naive_start) // step, 0)
+    while n > 0 and occurrence(n) > until:
+        n -= 1
+    while occurrence(n + 1) <= until:
+        n += 1
+    return occurrence(n)
+
+
+def _fast_forward_wall_clock_rrule(rrule, ref_dt):
+    '''
+    Fast forward a daily or weekly rrule so that iterating up to ref_dt is cheap.
+
+    dateutil steps days and weeks in wall clock time, so a UTC aligned dtstart
+    would move the time of day across DST changes. Instead the dtstart is moved
+    by whole steps in local time. Rules with BY* parts are left alone, as their
+    occurrences are not aligned to the interval.
+    '''
+    if rrule._freq not in {dateutil.rrule.WEEKLY, dateutil.rrule.DAILY} or rrule._count:
+        return rrule
+    if not isinstance(rrule._interval, int) or not _is_fixed_step_rrule(rrule):
+        return rrule
+
+    step = _rrule_step(rrule)
+    tzinfo = rrule._dtstart.tzinfo
+    naive_start = rrule._dtstart.replace(tzinfo=None)
+    naive_ref = ref_dt.astimezone(tzinfo).replace(tzinfo=None) if tzinfo else ref_dt.replace(tzinfo=None)
+    # stay one step behind ref_dt, so a UTC offset change can not carry the new dtstart past it
+    steps = (naive_ref - naive_start) // step - 1
+    if steps < 1:
+        return rrule
+    return rrule.replace(dtstart=(naive_start + steps * step).replace(tzinfo=tzinfo))
+
+
+@functools.lru_cache(maxsize=128)
+def _dtstart_tzinfo(start_date_rule):
+    # Only the DTSTART matters for the timezone, so parse it with a minimal rule
+    # instead of the rule being coerced, and remember the answer for the next save
+    temp_rule = '{} RRULE:FREQ=MINUTELY;INTERVAL=1;COUNT=1'.format(start_date_rule)
+    return dateutil.rrule.rrulestr(temp_rule, tzinfos=UTC_TIMEZONES, forceset=True)._rrule[0]._dtstart.tzinfo
+
+
+def _parse_rruleset(rrule, **kwargs):
+    rrule = Schedule.coerce_naive_until(rrule)
+    kwargs['forceset'] = True
+    rruleset = dateutil.rrule.rrulestr(rrule, tzinfos=UTC_TIMEZONES, **kwargs)
+
+    _assert_timezone_id_is_valid(rruleset._rrule)
+    _assert_timezone_id_is_valid(rruleset._exrule)
+    return rruleset
+
+
+# Schedules are parsed on every read and save, and the result only depends on the string
+_parse_rruleset_cached = functools.lru_cache(maxsize=1024)(_parse_rruleset)
+
+
+# The bundled zoneinfo does not change while the process runs
+@functools.cache
+def _sorted_zones():
+    return tuple(sorted(get_zonefile_instance().zones))
+
+
+@functools.cache
+def _zoneinfo_links():
+    zone_instance = get_zonefile_instance()
+    return {zone_name: tz._filename for zone_name, tz in zone_instance.zones.items() if str(zone_name) != str(tz._filename)}
+
+
+@functools.cache
+def _zones_longest_first():
+    return tuple(sorted(_sorted_zones(), key=lambda x: -len(x)))
+
+
+@functools.cache
+def _zone_for_filename(fname):
+    # tzfile paths are few and repeat constantly, so memoize the suffix scan per path
+    for zone in _zones_longest_first():
+        if fname.endswith(zone):
+            return zone
+    return None
+
+
 class ScheduleFilterMethods(object):
     def enabled(self, enabled=True):
         return self.filter(enabled=enabled)
@@ -160,31 +312,29 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
 
     @classmethod
     def get_zoneinfo(cls):
-        return sorted(get_zonefile_instance().zones)
+        return list(_sorted_zones())
 
     @classmethod
     def get_zoneinfo_links(cls):
-        return_val = {}
-        zone_instance = get_zonefile_instance()
-        for zone_name in zone_instance.zones:
-            if str(zone_name) != str(zone_instance.zones[zone_name]._filename):
-                return_val[zone_name] = zone_instance.zones[zone_name]._filename
-        return return_val
+        return dict(_zoneinfo_links())
 
     @property
     def timezone(self):
-        utc = tzutc()
+        # The TZID is the zone name, so read it from the text of the last DTSTART (the one dateutil uses)
+        # and only parse the rule when there is none, e.g. for DTSTART:...Z
+        tzids = DTSTART_TZID_RE.findall(self.rrule)
+        if tzids and tzids[-1]:
+            # rrulestr resolves the UTC aliases (GMT, Z, ...) to UTC, so report those the same way
+            return 'UTC' if tzids[-1] in UTC_TIMEZONES else tzids[-1]
         # All rules in a ruleset will have the same dtstart so we can just take the first rule
         tzinfo = Schedule.rrulestr(self.rrule)._rrule[0]._dtstart.tzinfo
-        if tzinfo is utc:
+        if tzinfo is _UTC_SINGLETON:
             return 'UTC'
-        all_zones = Schedule.get_zoneinfo()
-        all_zones.sort(key=lambda x: -len(x))
         fname = getattr(tzinfo, '_filename', None)
         if fname:
-            for zone in all_zones:
-                if fname.endswith(zone):
-                    return zone
+            zone = _zone_for_filename(fname)
+            if zone:
+                return zone
         logger.warning('Could not detect valid zoneinfo for {}'.format(self.rrule))
         return ''
 
@@ -219,17 +369,17 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
         #
 
         # Find the DTSTART rule or raise an error, its usually the first rule but that is not strictly enforced
-        start_date_rule = re.sub(r'^.*(DTSTART[^\s]+)\s.*$', r'\1', rrule)
+        start_date_rule = DTSTART_RE.sub(r'\1', rrule)
         if not start_date_rule:
             raise ValueError('A DTSTART field needs to be in the rrule')
 
-        rules = re.split(r'\s+', rrule)
+        rules = WHITESPACE_RE.split(rrule)
         for index in range(0, len(rules)):
             rule = rules[index]
             if 'until=' in rule.lower():
                 # if DTSTART;TZID= is used, coerce "naive" UNTIL values
                 # to the proper UTC date
-                match_until = re.match(r".*?(?P<until>UNTIL\=[0-9]+T[0-9]+)(?P<utcflag>Z?)", rule)
+                match_until = UNTIL_RE.match(rule)
                 if not len(match_until.group('utcflag')):
                     # rule = DTSTART;TZID=America/New_York:20200601T120000 RRULE:...;UNTIL=20200601T170000
 
@@ -240,16 +390,11 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
                     # What is the DTSTART timezone for:
                     # DTSTART;TZID=America/New_York:20200601T120000 RRULE:...;UNTIL=20200601T170000Z
                     # local_tz = tzfile('/usr/share/zoneinfo/America/New_York')
-                    # We are going to construct a 'dummy' rule for parsing which will include the DTSTART and the rest of the rule
-                    temp_rule = "{} {}".format(start_date_rule, rule.replace(naive_until, naive_until + 'Z'))
-                    # If the rule is an EX rule we have to add an RRULE to it because an EX rule alone will not manifest into a ruleset
-                    if rule.lower().startswith('ex'):
-                        temp_rule = "{} {}".format(temp_rule, 'RRULE:FREQ=MINUTELY;INTERVAL=1;UNTIL=20380601T170000Z')
-                    local_tz = dateutil.rrule.rrulestr(temp_rule, tzinfos=UTC_TIMEZONES, **{'forceset': True})._rrule[0]._dtstart.tzinfo
+                    local_tz = _dtstart_tzinfo(start_date_rule)
 
                     # Make a datetime object with tzinfo=<the DTSTART timezone>
                     # localized_until = datetime.datetime(2020, 6, 1, 17, 0, tzinfo=tzfile('/usr/share/zoneinfo/America/New_York'))
-                    localized_until = make_aware(datetime.datetime.strptime(re.sub('^UNTIL=', '', naive_until), "%Y%m%dT%H%M%S"), local_tz)
+                    localized_until = make_aware(datetime.datetime.strptime(naive_until.removeprefix('UNTIL='), "%Y%m%dT%H%M%S"), local_tz)
 
                     # Coerce the datetime to UTC and format it as a string w/ Zulu format
                     # utc_until = UNTIL=20200601T220000Z
@@ -265,12 +410,17 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
         """
         Apply our own custom rrule parsing requirements
         """
-        rrule = Schedule.coerce_naive_until(rrule)
-        kwargs['forceset'] = True
-        rruleset = dateutil.rrule.rrulestr(rrule, tzinfos=UTC_TIMEZONES, **kwargs)
+        if kwargs:
+            parsed = _parse_rruleset(rrule, **kwargs)
+        else:
+            parsed = _parse_rruleset_cached(rrule)
 
-        _assert_timezone_id_is_valid(rruleset._rrule)
-        _assert_timezone_id_is_valid(rruleset._exrule)
+        # The parsed ruleset may be shared through the cache, so fast forward on a copy
+        rruleset = copy.copy(parsed)
+        rruleset._rrule = list(parsed._rrule)
+        rruleset._exrule = list(parsed._exrule)
+        rruleset._rdate = list(parsed._rdate)
+        rruleset._exdate = list(parsed._exdate)
 
         # Fast forward is a way for us to limit the number of events in the rruleset
         # If we are fast forwarding and we don't have a count limited rule that is minutely or hourly
@@ -290,9 +440,13 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
 
     def get_job_kwargs(self):
         config_data = self.prompts_dict()
-        job_kwargs, rejected, errors = self.unified_job_template._accept_or_ignore_job_kwargs(**config_data)
-        if errors:
-            logger.info('Errors creating scheduled job: {}'.format(errors))
+        if config_data:
+            job_kwargs, rejected, errors = self.unified_job_template._accept_or_ignore_job_kwargs(**config_data)
+            if errors:
+                logger.info('Errors creating scheduled job: {}'.format(errors))
+        else:
+            # with nothing prompted the template accepts nothing, so skip its credential and resource checks
+            job_kwargs = {}
         job_kwargs['_eager_fields'] = {'launch_type': 'scheduled', 'schedule': self}
         return job_kwargs
 
@@ -305,6 +459,12 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
             if not a_rule._until and not a_rule._count:
                 return None
 
+        # A lone fixed step rule can have its last occurrence worked out directly, which avoids
+        # walking every occurrence between dtstart and until for minutely and hourly schedules
+        if len(ruleset._rrule) == 1 and not (ruleset._exrule or ruleset._rdate or ruleset._exdate) and _is_fixed_step_rrule(ruleset._rrule[0]):
+            last = _last_occurrence(ruleset._rrule[0])
+            return last.astimezone(datetime.timezone.utc) if last else None
+
         # If we made it this far we should have an end date and can ask the ruleset what the last date is
         # However, if the until/count is before dtstart we will get an IndexError when trying to get [-1]
         try:
@@ -321,11 +481,17 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
         future_rs = Schedule.rrulestr(self.rrule)
 
         if self.enabled:
-            next_run_actual = future_rs.after(now())
+            ref_dt = now()
+            # rrulestr keeps the past occurrences of daily and weekly rules, but only the
+            # future ones matter here, so skip over the past before searching
+            next_rs = copy.copy(future_rs)
+            next_rs._rrule = [_fast_forward_wall_clock_rrule(rule, ref_dt) for rule in future_rs._rrule]
+            next_rs._exrule = [_fast_forward_wall_clock_rrule(rule, ref_dt) for rule in future_rs._exrule]
+            next_run_actual = next_rs.after(ref_dt)
+            if next_run_actual is not None and not datetime_exists(next_run_actual):
+                # skip imaginary dates, like 2:30 on DST boundaries
+                next_run_actual = _next_existing_occurrence(next_rs, next_run_actual)
             if next_run_actual is not None:
-                if not datetime_exists(next_run_actual):
-                    # skip imaginary dates, like 2:30 on DST boundaries
-                    next_run_actual = future_rs.after(next_run_actual)
                 next_run_actual = next_run_actual.astimezone(datetime.timezone.utc)
         else:
             next_run_actual = None
@@ -353,9 +519,41 @@ class Schedule(PrimordialModel, LaunchTimeConfig):
         with ignore_inventory_computed_fields():
             self.unified_job_template.update_computed_fields()
 
+    @classmethod
+    def bulk_update_computed_fields(cls, schedules):
+        """
+        Recompute the computed fields of many schedules, saving them in one query
+        and refreshing each affected unified job template once
+        """
+        changed = [schedule for schedule in schedules if schedule.update_computed_fields_no_save()]
+        if not changed:
+            return
+        # bulk_update leaves modified alone, like update_computed_fields does
+        cls.objects.bulk_update(changed, ['next_run', 'dtstart', 'dtend'])
+        templates = {}
+        for schedule in changed:
+            emit_channel_notification('schedules-changed', dict(id=schedule.id, group_name='schedules'))
+            if schedule.unified_job_template_id not in templates:
+                templates[schedule.unified_job_template_id] = schedule.unified_job_template
+        with ignore_inventory_computed_fields():
+            for unified_job_template in templates.values():
+                unified_job_template.update_computed_fields()
+
+    def _computed_fields_are_current(self):
+        # next_run only moves when the rule, enabled flag or template change, or once it has passed
+        if not self.pk or 'rrule' not in self._prior_values_store:
+            return False
+        for field_name in ('rrule', 'enabled', 'unified_job_template_id'):
+            if getattr(self, field_name) != self._prior_values_store.get(field_name):
+                return False
+        return self.next_run is not None and self.next_run > now()
+
     def save(self, *args, **kwargs):
-        self.rrule = Schedule.coerce_naive_until(self.rrule)
-        changed = self.update_computed_fields_no_save()
+        if self._computed_fields_are_current():
+            changed = False
+        else:
+            self.rrule = Schedule.coerce_naive_until(self.rrule)
+            changed = self.update_computed_fields_no_save()
         if changed and 'update_fields' in kwargs:
             for field_name in ['next_run', 'dtstart', 'dtend']:
                 if field_name not in kwargs['update_fields']:
@@ -2,14 +2,14 @@
 # All Rights Reserved.
 
 # Python
-import json
 import logging
 
 # Django
 from django.conf import settings
 
 # AWX
-from awx.main.utils.redis import get_redis_client
+from awx.main.utils.json import dumps
+from awx.main.utils.redis import get_shared_redis_client
 
 __all__ = ['CallbackQueueDispatcher']
 
@@ -17,18 +17,23 @@ __all__ = ['CallbackQueueDispatcher']
 # use a custom JSON serializer so we can properly handle !unsafe and !vault
 # objects that may exist in events emitted by the callback plugin
 # see: https://github.com/ansible/ansible/pull/38759
-class AnsibleJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        if getattr(o, 'yaml_tag', None) == '!vault':
-            return o.data
-        return super(AnsibleJSONEncoder, self).default(o)
+def _ansible_default(o):
+    if getattr(o, 'yaml_tag', None) == '!vault':
+        return o.data
+    raise TypeError(f'Type is not JSON serializable: {type(o).__name__}')
+
+
+def _dumps(obj):
+    return dumps(obj, default=_ansible_default)
 
 
 class CallbackQueueDispatcher(object):
     def __init__(self):
         self.queue = getattr(settings, 'CALLBACK_QUEUE', '')
+        # redis-py would otherwise encode the key again for every event
+        self.queue_key = self.queue.encode()
         self.logger = logging.getLogger('awx.main.queue.CallbackQueueDispatcher')
-        self.connection = get_redis_client()
+        self.connection = get_shared_redis_client()
 
     def dispatch(self, obj):
-        self.connection.rpush(self.queue, json.dumps(obj, cls=AnsibleJSONEncoder))
+        self.connection.rpush(self.queue_key, _dumps(obj))
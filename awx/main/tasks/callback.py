@@ -9,10 +9,9 @@ from awx.main.models.event_query import EventQuery
 
 # Django
 from django.conf import settings
-from django.core.exceptions import ValidationError
 from django_guid import get_guid
 from django.utils.functional import cached_property
-from django.db import connections
+from django.db import connections, IntegrityError, transaction
 
 # AWX
 from awx.main.redact import UriCleaner
@@ -284,12 +283,13 @@ class RunnerCallback:
                 event_query = data['host_query']
                 instance = EventQuery(fqcn=collection, collection_version=version, event_query=event_query)
                 try:
-                    instance.validate_unique()
-                    instance.save()
+                    # the unique constraint rejects queries that were already saved
+                    with transaction.atomic():
+                        instance.save()
 
                     logger.info(f"eventy query for collection {collection}, version {version} created")
-                except ValidationError as e:
-                    logger.info(e)
+                except IntegrityError:
+                    logger.info(f'an event query for collection {collection}, version {version} already exists')
 
             if 'installed_collections' in query_file_contents:
                 self.delay_update(installed_collections=query_file_contents['installed_collections'])
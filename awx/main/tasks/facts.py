@@ -1,8 +1,8 @@
-import codecs
 import datetime
 import os
 import json
 import logging
+import time
 
 # Django
 from django.conf import settings
@@ -14,19 +14,34 @@ from ansible_base.lib.logging.runtime import log_excess_runtime
 
 # AWX
 from awx.main.utils.db import bulk_update_sorted_by_id
+from awx.main.utils.json import dumps, loads
 from awx.main.models import Host
 
-
 logger = logging.getLogger('awx.main.tasks.facts')
 system_tracking_logger = logging.getLogger('awx.analytics.system_tracking')
 
 
+def _is_safe_host_name(name):
+    # fact files are named after the host, so the name must stay a single path component
+    return name not in ('', '.', '..') and os.sep not in name and '\0' not in name
+
+
+def _write_facts_file(filepath, data):
+    # the mode is applied on create, so no separate chmod is needed
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 @log_excess_runtime(logger, debug_cutoff=0.01, msg='Inventory {inventory_id} host facts prepared for {written_ct} hosts, took {delta:.3f} s', add_log_data=True)
 def start_fact_cache(hosts, artifacts_dir, timeout=None, inventory_id=None, log_data=None):
     log_data = log_data or {}
     log_data['inventory_id'] = inventory_id
     log_data['written_ct'] = 0
-    hosts_cached = []
 
     # Create the fact_cache directory inside artifacts_dir
     fact_cache_dir = os.path.join(artifacts_dir, 'fact_cache')
@@ -37,36 +52,60 @@ def start_fact_cache(hosts, artifacts_dir, timeout=None, inventory_id=None, log_
 
     last_write_time = None
 
-    for host in hosts:
-        hosts_cached.append(host.name)
-        if not host.ansible_facts_modified or (timeout and host.ansible_facts_modified < now() - datetime.timedelta(seconds=timeout)):
-            continue  # facts are expired - do not write them
+    # The summary file goes directly to the artifacts_dir, host names are streamed into it as they are processed.
+    # It is closed after the last fact file, finish_fact_cache relies on its mtime.
+    summary_fp = None
+    if inventory_id is not None:
+        summary_fp = open(os.path.join(artifacts_dir, 'host_cache_summary.json'), 'w', encoding='utf-8')
+    try:
+        if summary_fp:
+            summary_fp.write('{"hosts_cached": [')
+
+        for i, host in enumerate(hosts):
+            if summary_fp:
+                summary_fp.write(f'{", " if i else ""}{json.dumps(host.name)}')
+            if not host.ansible_facts_modified or (timeout and host.ansible_facts_modified < now() - datetime.timedelta(seconds=timeout)):
+                continue  # facts are expired - do not write them
+
+            if not _is_safe_host_name(host.name):
+                logger.error(f'facts for host {smart_str(host.name)} could not be cached')
+                continue
+
+            filepath = os.path.join(fact_cache_dir, host.name)
+            try:
+                _write_facts_file(filepath, dumps(host.ansible_facts))
+                log_data['written_ct'] += 1
+                last_write_time = time.time()
+            except IOError:
+                logger.error(f'facts for host {smart_str(host.name)} could not be cached')
+                continue
 
-        filepath = os.path.join(fact_cache_dir, host.name)
-        if not os.path.realpath(filepath).startswith(fact_cache_dir):
-            logger.error(f'facts for host {smart_str(host.name)} could not be cached')
-            continue
+        if summary_fp:
+            summary_fp.write(f'], "written_ct": {log_data["written_ct"]}, "last_write_time": {json.dumps(last_write_time)}}}')
+    finally:
+        if summary_fp:
+            summary_fp.close()
 
-        try:
-            with codecs.open(filepath, 'w', encoding='utf-8') as f:
-                os.chmod(f.name, 0o600)
-                json.dump(host.ansible_facts, f)
-                log_data['written_ct'] += 1
-                last_write_time = os.path.getmtime(filepath)
-        except IOError:
-            logger.error(f'facts for host {smart_str(host.name)} could not be cached')
-            continue
 
-    # Write summary file directly to the artifacts_dir
-    if inventory_id is not None:
-        summary_file = os.path.join(artifacts_dir, 'host_cache_summary.json')
-        summary_data = {
-            'last_write_time': last_write_time,
-            'hosts_cached': hosts_cached,
-            'written_ct': log_data['written_ct'],
-        }
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2)
+def _read_facts_file(filepath):
+    fd = os.open(filepath, os.O_RDONLY | os.O_NOFOLLOW)
+    with os.fdopen(fd, 'rb') as f:
+        return f.read()
+
+
+def _scan_fact_files(fact_cache_dir):
+    # one directory listing instead of an exists and a getmtime call per host
+    stats = {}
+    try:
+        with os.scandir(fact_cache_dir) as it:
+            for entry in it:
+                try:
+                    stats[entry.name] = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return stats
 
 
 @log_excess_runtime(
@@ -96,26 +135,37 @@ def finish_fact_cache(artifacts_dir, job_id=None, inventory_id=None, log_data=No
         return
 
     host_names = summary.get('hosts_cached', [])
-    hosts_cached = Host.objects.filter(name__in=host_names).order_by('id').iterator()
+    hosts_cached = (
+        Host.objects.filter(name__in=host_names)
+        .select_related('inventory')
+        .only('id', 'name', 'ansible_facts', 'ansible_facts_modified', 'inventory__id', 'inventory__name')
+        .order_by('id')
+        .iterator(chunk_size=2000)
+    )
     # Path where individual fact files were written
     fact_cache_dir = os.path.join(artifacts_dir, 'fact_cache')
     hosts_to_update = []
+    fact_file_stats = _scan_fact_files(fact_cache_dir)
 
     for host in hosts_cached:
         filepath = os.path.join(fact_cache_dir, host.name)
-        if not os.path.realpath(filepath).startswith(fact_cache_dir):
+        if not _is_safe_host_name(host.name):
             logger.error(f'Invalid path for facts file: {filepath}')
             continue
 
-        if os.path.exists(filepath):
+        st = fact_file_stats.get(host.name)
+        if st is not None:
             # If the file changed since we wrote the last facts file, pre-playbook run...
-            modified = os.path.getmtime(filepath)
+            modified = st.st_mtime
             if not facts_write_time or modified >= facts_write_time:
                 try:
-                    with codecs.open(filepath, 'r', encoding='utf-8') as f:
-                        ansible_facts = json.load(f)
+                    ansible_facts = loads(_read_facts_file(filepath))
                 except ValueError:
                     continue
+                except OSError:
+                    # most likely a symlink, which is never followed
+                    logger.error(f'Invalid path for facts file: {filepath}')
+                    continue
 
                 if ansible_facts != host.ansible_facts:
                     host.ansible_facts = ansible_facts
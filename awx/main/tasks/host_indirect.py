@@ -1,5 +1,7 @@
+import json
 import logging
-from typing import Tuple, Union
+import operator
+from functools import reduce
 
 import yaml
 
@@ -8,6 +10,7 @@ import jq
 from django.utils.timezone import now, timedelta
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Q
 
 # Django flags
 from flags.state import flag_enabled
@@ -25,23 +28,20 @@ class UnhashableFacts(RuntimeError):
     pass
 
 
-def get_hashable_form(input_data: Union[dict, list, Tuple, int, float, str, bool]) -> Tuple[Union[Tuple, int, float, str, bool]]:
-    "Given a dictionary of JSON types, return something that can be hashed and is the same data"
-    if isinstance(input_data, (int, float, str, bool)):
-        return input_data  # return scalars as-is
-    if isinstance(input_data, dict):
-        # Can't hash because we got a dict? Make the dict a tuple of tuples.
-        # Can't hash the data in the tuple in the tuple? We'll make tuples out of them too.
-        return tuple(sorted(((get_hashable_form(k), get_hashable_form(v)) for k, v in input_data.items())))
-    elif isinstance(input_data, (list, tuple)):
-        # Nested list data might not be hashable, and lists were never hashable in the first place
-        return tuple(get_hashable_form(item) for item in input_data)
-    raise UnhashableFacts(f'Cannonical facts contains a {type(input_data)} type which can not be hashed.')
+def get_hashable_form(input_data) -> str:
+    "Given a structure of JSON types, return a canonical serialization of it that can be hashed"
+    try:
+        return json.dumps(input_data, sort_keys=True, separators=(',', ':'))
+    except TypeError as e:
+        raise UnhashableFacts(f'Cannonical facts can not be hashed: {e}')
 
 
 def build_indirect_host_data(job: Job, job_event_queries: dict[str, dict[str, str]]) -> list[IndirectManagedNodeAudit]:
+    if not job_event_queries:
+        return []  # no instrumented collections, do not read through the job events
+
     results = {}
-    compiled_jq_expressions = {}  # Cache for compiled jq expressions
+    compiled_jq_expressions = {}  # Cache for compiled jq expressions, keyed by the expression
     facts_missing_logged = False
     unhashable_facts_logged = False
 
@@ -54,11 +54,12 @@ def build_indirect_host_data(job: Job, job_event_queries: dict[str, dict[str, st
             continue
         job_event_queries_fqcn['.'.join(parts[0:2])] = query_v
 
-    for event in job.job_events.filter(event_data__isnull=False).iterator():
-        if 'res' not in event.event_data:
+    # only the event data is needed, skip building full JobEvent instances
+    for event_id, event_data in job.job_events.filter(event_data__isnull=False).values_list('id', 'event_data').iterator(chunk_size=1000):
+        if 'res' not in event_data:
             continue
 
-        if not (resolved_action := event.event_data.get('resolved_action', None)):
+        if not (resolved_action := event_data.get('resolved_action', None)):
             continue
 
         if len(resolved_action_parts := resolved_action.split('.')) != 3:
@@ -74,21 +75,20 @@ def build_indirect_host_data(job: Job, job_event_queries: dict[str, dict[str, st
             continue
 
         # Recall from cache, or process the jq expression, and loop over the jq results
-        if jq_str_for_event not in compiled_jq_expressions:
-            compiled_jq_expressions[resolved_action] = jq.compile(jq_str_for_event)
-        compiled_jq = compiled_jq_expressions[resolved_action]
+        if (compiled_jq := compiled_jq_expressions.get(jq_str_for_event)) is None:
+            compiled_jq = compiled_jq_expressions[jq_str_for_event] = jq.compile(jq_str_for_event)
 
         try:
-            data_source = compiled_jq.input(event.event_data['res']).all()
+            data_source = compiled_jq.input(event_data['res']).all()
         except Exception as e:
-            logger.warning(f'error for module {resolved_action} and data {event.event_data["res"]}: {e}')
+            logger.warning(f'error for module {resolved_action} and data {event_data["res"]}: {e}')
             continue
 
         for data in data_source:
             # From this jq result (specific to a single Ansible module), get index information about this host record
             if not data.get('canonical_facts'):
                 if not facts_missing_logged:
-                    logger.error(f'jq output missing canonical_facts for module {resolved_action} on event {event.id} using jq:{jq_str_for_event}')
+                    logger.error(f'jq output missing canonical_facts for module {resolved_action} on event {event_id} using jq:{jq_str_for_event}')
                     facts_missing_logged = True
                 continue
             canonical_facts = data['canonical_facts']
@@ -134,11 +134,17 @@ def fetch_job_event_query(job: Job) -> dict[str, dict[str, str]]:
     This contains all event query expressions that pertain to the given job
     """
     net_job_data = {}
-    for fqcn, collection_data in job.installed_collections.items():
-        event_query = EventQuery.objects.filter(fqcn=fqcn, collection_version=collection_data['version']).first()
-        if event_query:
-            collection_data = yaml.safe_load(event_query.event_query)
-            net_job_data.update(collection_data)
+    if not job.installed_collections:
+        return net_job_data
+
+    # one query for all collections, event queries are unique per collection version
+    versions = {fqcn: collection_data['version'] for fqcn, collection_data in job.installed_collections.items()}
+    lookup = reduce(operator.or_, (Q(fqcn=fqcn, collection_version=version) for fqcn, version in versions.items()))
+    event_queries = {fqcn: event_query for fqcn, event_query in EventQuery.objects.filter(lookup).values_list('fqcn', 'event_query')}
+
+    for fqcn in versions:
+        if fqcn in event_queries:
+            net_job_data.update(yaml.safe_load(event_queries[fqcn]))
     return net_job_data
 
 
@@ -146,7 +152,8 @@ def save_indirect_host_entries_of_job(job: Job) -> None:
     "Once we have a job and we know that we want to do indirect host processing, this is called"
     job_event_queries = fetch_job_event_query(job)
     records = build_indirect_host_data(job, job_event_queries)
-    IndirectManagedNodeAudit.objects.bulk_create(records)
+    # records are unique per (name, job), a name reported with different canonical_facts keeps its first record
+    IndirectManagedNodeAudit.objects.bulk_create(records, batch_size=1000, ignore_conflicts=True)
     job.event_queries_processed = True
 
 
@@ -924,9 +924,7 @@ def awx_periodic_scheduler():
         state.schedule_last_run = run_now
         state.save()
 
-        old_schedules = Schedule.objects.enabled().before(last_run)
-        for schedule in old_schedules:
-            schedule.update_computed_fields()
+        Schedule.bulk_update_computed_fields(Schedule.objects.enabled().before(last_run))
         schedules = Schedule.objects.enabled().between(last_run, run_now)
 
         invalid_license = False
@@ -0,0 +1,63 @@
+from unittest import mock
+
+import pytest
+
+from django.core.cache import cache
+from django.urls import resolve
+
+from awx.api.schema import AuthenticatedSpectacularAPIView
+from awx.api.versioning import reverse
+
+
+@pytest.fixture
+def schema_generator():
+    cache.clear()
+    with mock.patch.object(AuthenticatedSpectacularAPIView, 'generator_class') as generator_class:
+        generator = generator_class.return_value
+        generator.get_schema.return_value = {'openapi': '3.0.3', 'info': {'title': 'AWX API', 'version': 'v2'}, 'paths': {}}
+        yield generator
+    cache.clear()
+
+
+@pytest.fixture
+def schema_url():
+    return reverse('api:schema-json')
+
+
+def test_schema_url_routed_to_cached_view(schema_url):
+    assert schema_url == '/api/v2/docs/schema/'
+    assert resolve(schema_url).func.view_class is AuthenticatedSpectacularAPIView
+
+
+@pytest.mark.django_db
+def test_schema_served_from_cache(schema_generator, schema_url, get, admin):
+    first = get(schema_url, user=admin, expect=200, HTTP_AUTHORIZATION='Bearer admin-token')
+    second = get(schema_url, user=admin, expect=200, HTTP_AUTHORIZATION='Bearer admin-token')
+
+    assert schema_generator.get_schema.call_count == 1
+    assert second.content == first.content
+    assert 'Authorization' in second['Vary']
+    assert 'Cookie' in second['Vary']
+
+
+@pytest.mark.django_db
+def test_schema_cached_per_client(schema_generator, schema_url, get, admin, alice):
+    get(schema_url, user=admin, expect=200, HTTP_AUTHORIZATION='Bearer admin-token')
+    get(schema_url, user=alice, expect=200, HTTP_AUTHORIZATION='Bearer alice-token')
+    assert schema_generator.get_schema.call_count == 2
+
+    get(schema_url, user=admin, expect=200, HTTP_COOKIE='sessionid=admin-session')
+    get(schema_url, user=alice, expect=200, HTTP_COOKIE='sessionid=alice-session')
+    assert schema_generator.get_schema.call_count == 4
+
+    get(schema_url, user=alice, expect=200, HTTP_COOKIE='sessionid=alice-session')
+    assert schema_generator.get_schema.call_count == 4
+
+
+@pytest.mark.django_db
+def test_schema_cache_disabled(schema_generator, schema_url, get, admin, settings):
+    settings.API_SCHEMA_CACHE_TIMEOUT = 0
+    get(schema_url, user=admin, expect=200, HTTP_AUTHORIZATION='Bearer admin-token')
+    get(schema_url, user=admin, expect=200, HTTP_AUTHORIZATION='Bearer admin-token')
+
+    assert schema_generator.get_schema.call_count == 2
@@ -1,7 +1,7 @@
 import pytest
 
 from awx.main.migrations._db_constraints import _rename_duplicates
-from awx.main.models import JobTemplate
+from awx.main.models import JobTemplate, Organization
 
 
 @pytest.mark.django_db
@@ -54,3 +54,31 @@ def test_rename_job_template_name_too_long(organization, project):
         jt = JobTemplate.objects.get(id=pk)
         assert jt.name.endswith(f'dup{i}')
         assert len(jt.name) <= 512
+
+
+@pytest.mark.django_db
+def test_rename_job_template_duplicates_per_organization(organization, project):
+    other_org = Organization.objects.create(name='other-org')
+    ids = {}
+    for org in (organization, other_org):
+        ids[org.id] = []
+        for i in range(3):
+            jt = JobTemplate.objects.create(name=f'jt-{org.id}-{i}', organization=org, project=project)
+            ids[org.id].append(jt.id)
+
+    # Saving infers the organization from the project, so assign it afterwards
+    JobTemplate.objects.filter(id__in=ids[other_org.id]).update(organization=other_org)
+
+    all_ids = ids[organization.id] + ids[other_org.id]
+    JobTemplate.objects.filter(id__in=all_ids).update(org_unique=False)
+    JobTemplate.objects.filter(id__in=all_ids).update(name='same_name_for_test')
+
+    _rename_duplicates(JobTemplate)
+
+    # Numbering restarts in each organization
+    for org_ids in ids.values():
+        assert [JobTemplate.objects.get(id=pk).name for pk in org_ids] == [
+            'same_name_for_test',
+            'same_name_for_test_dup1',
+            'same_name_for_test_dup2',
+        ]
@@ -85,6 +85,22 @@ class TestComputedFields:
             assert s.next_run != old_next_run
             assert s.modified == prior_modified
 
+    def test_bulk_update_computed_fields(self, job_template):
+        schedules = [
+            Schedule.objects.create(name=name, rrule=self.continuing_rrule, unified_job_template=job_template, enabled=True) for name in ('first', 'second')
+        ]
+        old_next_run = datetime(2009, 3, 13, tzinfo=timezone.utc)
+        Schedule.objects.filter(pk__in=[s.pk for s in schedules]).update(next_run=old_next_run)
+        with self.assert_no_unwanted_stuff(schedules[0]):
+            with mock.patch('awx.main.models.schedules.emit_channel_notification') as emit:
+                with mock.patch.object(JobTemplate, 'update_computed_fields') as update_ujt:
+                    Schedule.bulk_update_computed_fields(Schedule.objects.filter(pk__in=[s.pk for s in schedules]))
+        assert emit.call_count == 2
+        update_ujt.assert_called_once()
+        for schedule in schedules:
+            schedule.refresh_from_db()
+            assert schedule.next_run > now()
+
     def test_computed_fields_turning_on(self, job_template):
         s = Schedule.objects.create(name='Some Schedule', rrule=self.distant_rrule, unified_job_template=job_template, enabled=False)
         # we expect 1 activity stream entry for changing enabled field
@@ -96,6 +112,31 @@ class TestComputedFields:
             assert s.next_run is not None
             assert job_template.next_schedule == s
 
+    def test_metadata_save_skips_recompute(self, job_template):
+        s = Schedule.objects.create(name='Some Schedule', rrule=self.distant_rrule, unified_job_template=job_template)
+        s = Schedule.objects.get(pk=s.pk)
+        s.name = 'Renamed Schedule'
+        with mock.patch.object(Schedule, 'update_computed_fields_no_save') as recompute:
+            s.save()
+        recompute.assert_not_called()
+
+    @pytest.mark.parametrize('field_name, value', [('rrule', continuing_rrule), ('enabled', False)])
+    def test_schedule_edit_recomputes(self, job_template, field_name, value):
+        s = Schedule.objects.create(name='Some Schedule', rrule=self.distant_rrule, unified_job_template=job_template)
+        s = Schedule.objects.get(pk=s.pk)
+        setattr(s, field_name, value)
+        with mock.patch.object(Schedule, 'update_computed_fields_no_save', return_value=False) as recompute:
+            s.save()
+        recompute.assert_called_once()
+
+    def test_past_next_run_recomputes_on_save(self, job_template):
+        s = Schedule.objects.create(name='Some Schedule', rrule=self.continuing_rrule, unified_job_template=job_template)
+        Schedule.objects.filter(pk=s.pk).update(next_run=datetime(2009, 3, 13, tzinfo=timezone.utc))
+        s = Schedule.objects.get(pk=s.pk)
+        s.name = 'Renamed Schedule'
+        s.save()
+        assert s.next_run > now()
+
     def test_computed_fields_turning_on_via_rrule(self, job_template):
         s = Schedule.objects.create(name='Some Schedule', rrule=self.dead_rrule, unified_job_template=job_template)
         with self.assert_no_unwanted_stuff(s, act_stream=False):
@@ -275,6 +316,37 @@ def test_dst_phantom_hour(job_template):
     assert str(s.next_run) == '2030-03-17 06:30:00+00:00'
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'rrule, ref_dt, next_run',
+    [
+        # 3/10/30 @ 2:30AM does not exist, so the daily run moves to the next day
+        [
+            'DTSTART;TZID=America/New_York:20300303T023000 RRULE:FREQ=DAILY;INTERVAL=1',
+            datetime(2030, 3, 10, 5, tzinfo=timezone.utc),
+            '2030-03-11 06:30:00+00:00',
+        ],
+        # every occurrence inside the missing hour is skipped
+        [
+            'DTSTART;TZID=America/New_York:20300310T021000 RRULE:FREQ=MINUTELY;INTERVAL=20',
+            datetime(2030, 3, 10, 6, tzinfo=timezone.utc),
+            '2030-03-10 07:10:00+00:00',
+        ],
+        # and if the rule ends inside the missing hour there is no next run
+        [
+            'DTSTART;TZID=America/New_York:20300310T021000 RRULE:FREQ=MINUTELY;INTERVAL=20;UNTIL=20300310T070500Z',
+            datetime(2030, 3, 10, 6, tzinfo=timezone.utc),
+            'None',
+        ],
+    ],
+)
+def test_dst_phantom_hour_fixed_step(job_template, rrule, ref_dt, next_run):
+    with mock.patch('awx.main.models.schedules.now', lambda: ref_dt):
+        s = Schedule(name='Some Schedule', rrule=rrule, unified_job_template=job_template)
+        s.save()
+    assert str(s.next_run) == next_run
+
+
 @pytest.mark.django_db
 @pytest.mark.timeout(3)
 def test_beginning_of_time(job_template):
@@ -292,6 +364,9 @@ def test_beginning_of_time(job_template):
     'rrule, tz',
     [
         ['DTSTART:20300112T210000Z RRULE:FREQ=DAILY;INTERVAL=1', 'UTC'],
+        ['DTSTART;TZID=UTC:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1', 'UTC'],
+        ['DTSTART;TZID=GMT:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1', 'UTC'],
+        ['DTSTART;TZID=Z:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1', 'UTC'],
         ['DTSTART;TZID=US/Eastern:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1', 'US/Eastern'],
         ['DTSTART;TZID=US/Eastern:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1 EXRULE:FREQ=WEEKLY;INTERVAL=1;BYDAY=SU', 'US/Eastern'],
         # Technically the serializer should never let us get 2 dtstarts in a rule but its still valid and the rrule will prefer the last DTSTART
@@ -299,6 +374,7 @@ def test_beginning_of_time(job_template):
             'DTSTART;TZID=US/Eastern:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1 EXRULE:FREQ=WEEKLY;INTERVAL=1;BYDAY=SU DTSTART;TZID=US/Pacific:20300112T210000',
             'US/Pacific',
         ],
+        ['DTSTART;TZID=US/Eastern:20300112T210000 RRULE:FREQ=DAILY;INTERVAL=1 DTSTART:20300112T210000Z', 'UTC'],
     ],
 )
 def test_timezone_property(job_template, rrule, tz):
@@ -354,6 +430,25 @@ def test_empty_until_property(job_template):
     assert s.until == ''
 
 
+@pytest.mark.django_db
+def test_get_job_kwargs_without_prompts(job_template):
+    s = Schedule.objects.create(name='Some Schedule', rrule='DTSTART:20300112T210000Z RRULE:FREQ=DAILY;INTERVAL=1', unified_job_template=job_template)
+    with mock.patch.object(JobTemplate, '_accept_or_ignore_job_kwargs') as accept_or_ignore:
+        job_kwargs = s.get_job_kwargs()
+    accept_or_ignore.assert_not_called()
+    assert job_kwargs == {'_eager_fields': {'launch_type': 'scheduled', 'schedule': s}}
+
+
+@pytest.mark.django_db
+def test_get_job_kwargs_with_prompts(job_template):
+    job_template.ask_limit_on_launch = True
+    job_template.save()
+    s = Schedule.objects.create(name='Some Schedule', rrule='DTSTART:20300112T210000Z RRULE:FREQ=DAILY;INTERVAL=1', unified_job_template=job_template)
+    s.limit = 'foobar'
+    s.save()
+    assert s.get_job_kwargs()['limit'] == 'foobar'
+
+
 @pytest.mark.django_db
 def test_duplicate_name_across_templates(job_template):
     # Assert that duplicate name is allowed for different unified job templates.
@@ -469,6 +564,15 @@ def test_skip_sundays():
     assert len(list(gen)) == 0
 
 
+def test_rrulestr_fast_forward_does_not_leak_between_calls():
+    rrule = 'DTSTART;TZID=UTC:20200101T000000 RRULE:FREQ=HOURLY;INTERVAL=1'
+    first = Schedule.rrulestr(rrule, ref_dt=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    second = Schedule.rrulestr(rrule, ref_dt=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    assert first._rrule[0]._dtstart == datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert second._rrule[0]._dtstart == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert first._rrule is not second._rrule
+
+
 # Test the get_end_date function
 @pytest.mark.django_db
 @pytest.mark.parametrize(
@@ -534,6 +638,21 @@ def test_skip_sundays():
             None,
             id="Rule with until that ends in the past",
         ),
+        pytest.param(
+            'DTSTART;TZID=America/New_York:20300301T001500 RRULE:INTERVAL=7;FREQ=MINUTELY;UNTIL=20300315T120000Z',
+            datetime(2030, 3, 15, 11, 57, tzinfo=timezone.utc),
+            id="Minutely rule with until across a DST change",
+        ),
+        pytest.param(
+            'DTSTART;TZID=America/New_York:20301101T003000 RRULE:INTERVAL=5;FREQ=HOURLY;UNTIL=20301110T000000Z',
+            datetime(2030, 11, 9, 23, 30, tzinfo=timezone.utc),
+            id="Hourly rule with until across a DST change",
+        ),
+        pytest.param(
+            'DTSTART;TZID=America/New_York:20300310T150000 RRULE:INTERVAL=2;FREQ=HOURLY;COUNT=10',
+            datetime(2030, 3, 11, 13, 0, tzinfo=timezone.utc),
+            id="Hourly rule with count",
+        ),
     ],
 )
 def test_get_end_date(rrule, expected_result):
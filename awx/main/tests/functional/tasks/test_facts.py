@@ -0,0 +1,85 @@
+import json
+import os
+import time
+
+import pytest
+
+from awx.main.models import Host
+from awx.main.tasks.facts import start_fact_cache, finish_fact_cache
+
+from django.utils.timezone import now
+
+
+@pytest.fixture
+def fact_hosts(inventory):
+    return [inventory.hosts.create(name=f'host{i}', ansible_facts={'a': i}, ansible_facts_modified=now()) for i in range(3)]
+
+
+@pytest.mark.django_db
+def test_finish_fact_cache_updates_and_clears(fact_hosts, inventory, tmpdir):
+    artifacts_dir = str(tmpdir)
+    start_fact_cache(fact_hosts, artifacts_dir, timeout=0, inventory_id=inventory.id)
+    fact_cache_dir = os.path.join(artifacts_dir, 'fact_cache')
+
+    # host0 is left untouched, host1 gets new facts and host2 has its facts cleared
+    filepath = os.path.join(fact_cache_dir, 'host1')
+    with open(filepath, 'w') as f:
+        json.dump({'a': 'new'}, f)
+    future = time.time() + 3600
+    os.utime(filepath, (future, future))
+    os.remove(os.path.join(fact_cache_dir, 'host2'))
+
+    finish_fact_cache(artifacts_dir, inventory_id=inventory.id)
+
+    facts = dict(Host.objects.filter(inventory=inventory).values_list('name', 'ansible_facts'))
+    assert facts == {'host0': {'a': 0}, 'host1': {'a': 'new'}, 'host2': {}}
+
+
+@pytest.mark.django_db
+def test_finish_fact_cache_without_fact_cache_dir(fact_hosts, inventory, tmpdir):
+    artifacts_dir = str(tmpdir)
+    start_fact_cache(fact_hosts, artifacts_dir, timeout=0, inventory_id=inventory.id)
+    for host in fact_hosts:
+        os.remove(os.path.join(artifacts_dir, 'fact_cache', host.name))
+    os.rmdir(os.path.join(artifacts_dir, 'fact_cache'))
+
+    finish_fact_cache(artifacts_dir, inventory_id=inventory.id)
+
+    assert not Host.objects.filter(inventory=inventory).exclude(ansible_facts={}).exists()
+
+
+@pytest.mark.django_db
+def test_finish_fact_cache_ignores_symlinks(fact_hosts, inventory, tmpdir):
+    artifacts_dir = str(tmpdir)
+    start_fact_cache(fact_hosts, artifacts_dir, timeout=0, inventory_id=inventory.id)
+
+    outside = os.path.join(artifacts_dir, 'outside.json')
+    with open(outside, 'w') as f:
+        json.dump({'secret': 'value'}, f)
+    future = time.time() + 3600
+    os.utime(outside, (future, future))
+    filepath = os.path.join(artifacts_dir, 'fact_cache', 'host1')
+    os.remove(filepath)
+    os.symlink(outside, filepath)
+
+    finish_fact_cache(artifacts_dir, inventory_id=inventory.id)
+
+    assert Host.objects.get(inventory=inventory, name='host1').ansible_facts == {'a': 1}
+
+
+@pytest.mark.django_db
+def test_finish_fact_cache_query_count(fact_hosts, inventory, tmpdir, django_assert_num_queries):
+    artifacts_dir = str(tmpdir)
+    start_fact_cache(fact_hosts, artifacts_dir, timeout=0, inventory_id=inventory.id)
+    future = time.time() + 3600
+    for host in fact_hosts:
+        filepath = os.path.join(artifacts_dir, 'fact_cache', host.name)
+        with open(filepath, 'w') as f:
+            json.dump({'a': 'new'}, f)
+        os.utime(filepath, (future, future))
+
+    # one select, with the inventory used for logging joined in, and one update
+    with django_assert_num_queries(2):
+        finish_fact_cache(artifacts_dir, inventory_id=inventory.id)
+
+    assert list(Host.objects.filter(inventory=inventory).values_list('ansible_facts', flat=True)) == [{'a': 'new'}] * 3
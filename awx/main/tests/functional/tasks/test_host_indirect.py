@@ -1,3 +1,4 @@
+import jq
 import yaml
 from functools import reduce
 from unittest import mock
@@ -364,3 +365,49 @@ def test_cleanup_old_audit_records(old_audit_record, new_audit_record):
     cleanup_and_save_indirect_host_entries_fallback()
     count_after_cleanup = IndirectManagedNodeAudit.objects.count()
     assert count_after_cleanup == 1
+
+
+@pytest.mark.django_db
+def test_build_indirect_host_data_compiles_query_once(bare_job):
+    for task_name in ('demo.query.example', 'demo.query.example', 'demo.query.example2', 'demo2.query.example'):
+        create_registered_event(bare_job, task_name)
+    queries = {'demo.query.*': {'query': TEST_JQ}, 'demo2.query.example': {'query': TEST_JQ}}
+
+    with mock.patch('awx.main.tasks.host_indirect.jq.compile', wraps=jq.compile) as jq_compile:
+        data = build_indirect_host_data(bare_job, queries)
+
+    jq_compile.assert_called_once_with(TEST_JQ)
+    assert len(data) == 1
+    assert data[0].count == 4
+
+
+@pytest.mark.django_db
+def test_save_indirect_host_entries_duplicate_name(bare_job):
+    Query('demo.query.example', TEST_JQ).create_event_query()
+    for host_name in ('foo_host', 'bar_host'):
+        bare_job.job_events.create(event_data={'resolved_action': 'demo.query.example', 'res': {'direct_host_name': host_name, 'name': 'vm-foo'}})
+
+    save_indirect_host_entries(bare_job.id)
+    bare_job.refresh_from_db()
+
+    assert bare_job.event_queries_processed is True
+    assert IndirectManagedNodeAudit.objects.filter(job=bare_job, name='vm-foo').count() == 1
+
+
+@pytest.mark.django_db
+def test_build_indirect_host_data_without_queries(job_with_counted_event, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert build_indirect_host_data(job_with_counted_event, {}) == []
+
+
+@pytest.mark.django_db
+def test_fetch_job_event_query_single_query(bare_job, django_assert_num_queries):
+    Query('demo.query.example', TEST_JQ).create_event_query()
+    Query('demo2.query.example', TEST_JQ).create_event_query()
+    # same collection, but a version the job does not have installed
+    EventQuery.objects.create(fqcn='demo.query', collection_version='2.0.0', event_query=yaml.dump({'demo.query.other': {'query': TEST_JQ}}))
+
+    with django_assert_num_queries(1):
+        queries = fetch_job_event_query(bare_job)
+
+    assert queries == {'demo.query.example': {'query': TEST_JQ}, 'demo2.query.example': {'query': TEST_JQ}}
@@ -0,0 +1,56 @@
+import pytest
+
+from django.db import connection
+
+from awx.main.dispatch.worker.dispatcherd import AWXTaskWorker
+
+
+@pytest.fixture
+def worker_connection():
+    settings_dict = connection.settings_dict.copy()
+    connection.close()
+    yield connection
+    connection.close()
+    connection.settings_dict.clear()
+    connection.settings_dict.update(settings_dict)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_connection_reused_across_tasks(worker_connection):
+    AWXTaskWorker.on_start(None)
+    raw_connection = worker_connection.connection
+    assert raw_connection is not None
+
+    for _ in range(3):
+        AWXTaskWorker.pre_task(None, {})
+        with worker_connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        assert worker_connection.connection is raw_connection
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_connection_health_checked_before_each_task(worker_connection):
+    AWXTaskWorker.on_start(None)
+    assert worker_connection.health_check_enabled is True
+
+    worker_connection.health_check_done = True
+    AWXTaskWorker.pre_task(None, {})
+    assert worker_connection.health_check_done is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_connection_closed_when_obsolete(worker_connection, settings):
+    settings.DISPATCHER_WORKER_DATABASES = {'default': {'CONN_MAX_AGE': 0}}
+    AWXTaskWorker.on_start(None)
+
+    AWXTaskWorker.pre_task(None, {})
+    assert worker_connection.connection is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_connection_closed_when_left_in_transaction(worker_connection):
+    AWXTaskWorker.on_start(None)
+    worker_connection.set_autocommit(False)
+
+    AWXTaskWorker.pre_task(None, {})
+    assert worker_connection.connection is None
@@ -160,6 +160,23 @@ class TestCustomAutoSchema:
         tags = schema.get_tags()
         assert tags == ['Multi_Word_Topic']
 
+    def test_get_tags_cached_per_view_class(self):
+        """Test get_tags is computed once per view class and reused."""
+
+        class CachedView:
+            model = Mock()
+
+        CachedView.model._meta.verbose_name_plural = 'cached models'
+
+        schema = CustomAutoSchema()
+        schema.view = CachedView()
+        assert schema.get_tags() == ['Cached Models']
+
+        CachedView.model._meta.verbose_name_plural = 'changed models'
+        schema = CustomAutoSchema()
+        schema.view = CachedView()
+        assert schema.get_tags() == ['Cached Models']
+
     def test_is_deprecated_true(self):
         """Test is_deprecated returns True when view has deprecated=True."""
         view = Mock()
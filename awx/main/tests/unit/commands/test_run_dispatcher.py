@@ -0,0 +1,31 @@
+import asyncio
+from unittest import mock
+
+from awx.main.management.commands import run_dispatcher
+from awx.main.management.commands.run_dispatcher import Command
+
+
+class FakeControl:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def acontrol_with_reply(self, command, data=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return [{'command': command, 'uuid': data['uuid']}]
+
+
+@mock.patch('awx.main.management.commands.run_dispatcher.flag_enabled', return_value=True)
+def test_cancel_limits_concurrent_replies(flag_enabled, capsys):
+    ctl = FakeControl()
+    task_ids = [f'task-{i}' for i in range(run_dispatcher.MAX_CONCURRENT_CANCELS * 3)]
+    with mock.patch('awx.main.management.commands.run_dispatcher.get_control_from_settings', return_value=ctl):
+        Command().handle(cancel=str(task_ids))
+
+    assert ctl.peak == run_dispatcher.MAX_CONCURRENT_CANCELS
+    output = capsys.readouterr().out
+    for task_id in task_ids:
+        assert f'uuid: {task_id}' in output
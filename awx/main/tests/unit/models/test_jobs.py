@@ -148,3 +148,31 @@ def test_finish_job_fact_cache_with_bad_data(hosts, mocker, tmpdir):
     finish_fact_cache(fact_cache)
 
     bulk_update.assert_not_called()
+
+
+def test_start_job_fact_cache_file_mode(hosts, tmpdir):
+    artifacts_dir = tmpdir.mkdir("artifacts")
+    start_fact_cache(hosts, str(artifacts_dir), timeout=0)
+
+    fact_cache_dir = os.path.join(artifacts_dir, 'fact_cache')
+    for host in hosts:
+        assert os.stat(os.path.join(fact_cache_dir, host.name)).st_mode & 0o777 == 0o600
+
+
+def test_start_job_fact_cache_summary(hosts, tmpdir):
+    artifacts_dir = tmpdir.mkdir("artifacts")
+    start_fact_cache(hosts + [Host(name='../foo', ansible_facts={}, ansible_facts_modified=now())], str(artifacts_dir), timeout=0, inventory_id=42)
+
+    with open(os.path.join(artifacts_dir, 'host_cache_summary.json'), encoding='utf-8') as f:
+        summary = json.load(f)
+    assert summary['hosts_cached'] == [host.name for host in hosts] + ['../foo']
+    assert summary['written_ct'] == len(hosts)
+    assert summary['last_write_time'] <= time.time()
+
+
+def test_start_job_fact_cache_summary_no_hosts(tmpdir):
+    artifacts_dir = tmpdir.mkdir("artifacts")
+    start_fact_cache([], str(artifacts_dir), timeout=0, inventory_id=42)
+
+    with open(os.path.join(artifacts_dir, 'host_cache_summary.json'), encoding='utf-8') as f:
+        assert json.load(f) == {'hosts_cached': [], 'written_ct': 0, 'last_write_time': None}
@@ -2,7 +2,7 @@ import copy
 
 import pytest
 
-from awx.main.tasks.host_indirect import get_hashable_form
+from awx.main.tasks.host_indirect import get_hashable_form, UnhashableFacts
 
 
 class TestHashableForm:
@@ -18,6 +18,8 @@ class TestHashableForm:
             ['a', ['b', 'c']],
             ['a', ('b', 'c')],
             ['a', {'b': 'c'}],
+            {'b': 'c', 'a': 2**70},
+            {'a': None},
         ],
     )
     def test_compare_equal_data(self, data):
@@ -45,6 +47,7 @@ class TestHashableForm:
             [['a', ['b', 'c']], ['a', ['b', 'd']]],
             [['a', ('b', 'c')], ['a', ('b', 'd')]],
             [['a', {'b': 'c'}], ['a', {'b': 'd'}]],
+            [{'a': None}, {'a': float('nan')}],
         ],
     )
     def test_compare_different_data(self, data, other_data):
@@ -54,3 +57,10 @@ class TestHashableForm:
 
         assert get_hashable_form(other_data) not in {get_hashable_form(data): 1}  # test lookup miss
         assert get_hashable_form(data) not in {get_hashable_form(other_data): 1}
+
+    def test_key_order_is_ignored(self):
+        assert get_hashable_form({'a': 1, 'b': {'c': 2, 'd': 3}}) == get_hashable_form({'b': {'d': 3, 'c': 2}, 'a': 1})
+
+    def test_unhashable_data(self):
+        with pytest.raises(UnhashableFacts):
+            get_hashable_form({'a': object()})
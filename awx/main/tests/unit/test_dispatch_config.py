@@ -0,0 +1,43 @@
+from unittest import mock
+
+import pytest
+
+from awx.main.dispatch.config import get_dispatcherd_config
+from awx.main.dispatch.pool import AutoscalePool, get_auto_min_workers
+
+
+@pytest.fixture
+def many_cpus(settings):
+    settings.DISPATCHER_MIN_WORKERS = None
+    settings.SYSTEM_TASK_ABS_CPU = None
+    with mock.patch('awx.main.dispatch.pool.get_cpu_count', return_value=64):
+        yield
+
+
+def test_min_workers_from_cpu_count(many_cpus):
+    assert get_auto_min_workers(100) == 32
+
+
+def test_min_workers_from_corrected_cpu_count(many_cpus, settings):
+    settings.SYSTEM_TASK_ABS_CPU = '2'
+    assert get_auto_min_workers(100) == 4
+
+
+def test_min_workers_setting(many_cpus, settings):
+    settings.DISPATCHER_MIN_WORKERS = 6
+    assert get_auto_min_workers(100) == 6
+
+
+@mock.patch('awx.main.dispatch.config.get_task_queuename', return_value='tower')
+@mock.patch('awx.main.dispatch.config.get_pg_notify_params', return_value={})
+@mock.patch('awx.main.dispatch.config.get_auto_max_workers', return_value=9)
+def test_dispatcherd_min_workers_capped_at_max_workers(get_auto_max_workers, get_pg_notify_params, get_task_queuename, many_cpus):
+    pool_kwargs = get_dispatcherd_config(for_service=True)['service']['pool_kwargs']
+    assert pool_kwargs['max_workers'] == 9
+    assert pool_kwargs['min_workers'] <= pool_kwargs['max_workers']
+
+
+def test_autoscale_pool_min_workers_capped_at_max_workers(many_cpus):
+    pool = AutoscalePool(min_workers=get_auto_min_workers(9), max_workers=9)
+    assert pool.max_workers == 9
+    assert pool.min_workers <= pool.max_workers
@@ -0,0 +1,18 @@
+import json
+
+import pytest
+
+from awx.main import queue
+
+
+@pytest.mark.parametrize(
+    'event',
+    [
+        {'counter': 1, 'stdout': 'ok: [localhost]'},
+        {'event_data': {'res': {1: 'integer keys', 'big': 2**70}}},
+        {'event_data': {'res': {'secret': type('Vaulted', (), {'yaml_tag': '!vault', 'data': '$ANSIBLE_VAULT;1.1'})()}}},
+    ],
+)
+def test_dumps_round_trips(event):
+    expected = json.loads(json.dumps(event, default=queue._ansible_default))
+    assert json.loads(queue._dumps(event)) == expected
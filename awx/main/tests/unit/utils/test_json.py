@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Ansible, Inc.
+# All Rights Reserved
+
+import pytest
+
+from awx.main.utils.json import dumps, loads
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        {'a': 1, 'b': [2, 3]},
+        {'distribution': u'Iñtërnâtiônàlizætiøn'},
+        {'big': 2**70},
+    ],
+)
+def test_round_trip(obj):
+    data = dumps(obj)
+    assert isinstance(data, bytes)
+    assert loads(data) == obj
+
+
+def test_dumps_stringifies_keys():
+    assert loads(dumps({1: 'a', 'nested': {2: 'b', 'big': 2**70}})) == {'1': 'a', 'nested': {'2': 'b', 'big': 2**70}}
+
+
+def test_dumps_default():
+    assert loads(dumps({'a': frozenset([1])}, default=list)) == {'a': [1]}
+    assert loads(dumps({'a': frozenset([1]), 'big': 2**70}, default=list)) == {'a': [1], 'big': 2**70}
+
+
+def test_dumps_without_default_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({'a': object()})
+
+
+def test_loads_accepts_infinity():
+    assert loads(b'{"a": Infinity}') == {'a': float('inf')}
+
+
+def test_loads_rejects_bad_data():
+    with pytest.raises(ValueError):
+        loads(b'not valid json!')
@@ -3,9 +3,10 @@
 # Copyright (c) 2025 Ansible, Inc.
 # All Rights Reserved
 
+import redis
 from django.test.utils import override_settings
 
-from awx.main.utils.redis import get_redis_client, get_redis_client_async
+from awx.main.utils.redis import get_redis_client, get_redis_client_async, get_shared_redis_client
 from redis.exceptions import BusyLoadingError, ConnectionError, TimeoutError
 from redis.backoff import ExponentialBackoff
 
@@ -59,3 +60,34 @@ class TestRedisRetryConfiguration:
         # Assert provided values match values on object
         assert backoff._cap == 2.0
         assert backoff._base == 1.0
+
+
+class TestSharedRedisClient:
+    """Verify the process wide client reuses one pool and keeps the retry configuration."""
+
+    def setup_method(self):
+        get_shared_redis_client.cache_clear()
+
+    def teardown_method(self):
+        get_shared_redis_client.cache_clear()
+
+    def test_shared_client_is_reused(self):
+        client = get_shared_redis_client()
+
+        assert client is get_shared_redis_client()
+        assert isinstance(client.connection_pool, redis.BlockingConnectionPool)
+        assert ConnectionError in client.connection_pool.connection_kwargs['retry_on_error']
+
+    @override_settings(BROKER_URL='unix:///var/run/redis/redis.sock')
+    def test_unix_socket_has_no_keepalive(self):
+        kwargs = get_shared_redis_client().connection_pool.connection_kwargs
+
+        assert kwargs['health_check_interval'] == 30
+        assert 'socket_keepalive' not in kwargs
+
+    @override_settings(BROKER_URL='redis://localhost:6379/0')
+    def test_tcp_has_keepalive(self):
+        kwargs = get_shared_redis_client().connection_pool.connection_kwargs
+
+        assert kwargs['health_check_interval'] == 30
+        assert kwargs['socket_keepalive'] is True
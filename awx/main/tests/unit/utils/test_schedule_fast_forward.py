@@ -4,8 +4,8 @@ import dateutil
 
 from django.utils.timezone import now
 
-from awx.main.models.schedules import _fast_forward_rrule, Schedule
-from dateutil.rrule import HOURLY, MINUTELY, MONTHLY
+from awx.main.models.schedules import _fast_forward_rrule, _fast_forward_wall_clock_rrule, Schedule
+from dateutil.rrule import DAILY, HOURLY, MINUTELY, MONTHLY, WEEKLY
 
 REF_DT = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
 
@@ -146,6 +146,48 @@ def test_multiple_rrules():
     assert occurrences == orig_occurrences
 
 
+@pytest.mark.parametrize(
+    'rrulestr',
+    [
+        pytest.param('DTSTART;TZID=America/New_York:20201118T200000 RRULE:FREQ=DAILY;INTERVAL=3', id='every-3-days'),
+        pytest.param('DTSTART;TZID=America/New_York:20201118T200000 RRULE:FREQ=WEEKLY;INTERVAL=2', id='every-2-weeks'),
+        pytest.param('DTSTART;TZID=America/New_York:20240318T023000 RRULE:FREQ=WEEKLY;INTERVAL=1', id='weekly-in-dst'),
+        pytest.param('DTSTART;TZID=Europe/Lisbon:20201118T200000 RRULE:FREQ=DAILY;INTERVAL=1;UNTIL=20300101T000000Z', id='daily-with-until'),
+    ],
+)
+@pytest.mark.parametrize(
+    'ref_dt',
+    [
+        pytest.param(datetime.datetime(2024, 12, 1, 0, 0, tzinfo=datetime.timezone.utc), id='ref-dt-out-of-dst'),
+        pytest.param(datetime.datetime(2024, 6, 1, 0, 0, tzinfo=datetime.timezone.utc), id='ref-dt-in-dst'),
+    ],
+)
+def test_fast_forward_wall_clock_rrule(rrulestr, ref_dt):
+    '''
+    Assert that a fast forwarded daily or weekly rrule keeps its local time of day
+    and matches the original occurrences after ref_dt
+    '''
+    rrule = dateutil.rrule.rrulestr(rrulestr)
+    new_rrule = _fast_forward_wall_clock_rrule(rrule, ref_dt)
+
+    assert new_rrule._dtstart.year == 2024
+    assert new_rrule._dtstart.time() == rrule._dtstart.time()
+    assert list(new_rrule.xafter(ref_dt, count=200)) == list(rrule.xafter(ref_dt, count=200))
+
+
+@pytest.mark.parametrize(
+    'rrule',
+    [
+        pytest.param(dateutil.rrule.rrule(freq=DAILY, byhour=(3, 15), dtstart=REF_DT - datetime.timedelta(days=30)), id='by-hour'),
+        pytest.param(dateutil.rrule.rrule(freq=WEEKLY, byweekday=(0, 4), dtstart=REF_DT - datetime.timedelta(days=30)), id='by-day'),
+        pytest.param(dateutil.rrule.rrule(freq=DAILY, count=50, dtstart=REF_DT - datetime.timedelta(days=30)), id='count'),
+        pytest.param(dateutil.rrule.rrule(freq=HOURLY, dtstart=REF_DT - datetime.timedelta(days=30)), id='hourly'),
+    ],
+)
+def test_does_not_fast_forward_wall_clock(rrule):
+    assert rrule == _fast_forward_wall_clock_rrule(rrule, REF_DT)
+
+
 def test_future_date_does_not_fast_forward():
     dtstart = now() + datetime.timedelta(days=30)
     rrule = dateutil.rrule.rrule(freq=HOURLY, interval=7, dtstart=dtstart)
@@ -1219,4 +1219,7 @@ def unified_job_class_to_event_table_name(job_class):
 
 
 def load_all_entry_points_for(entry_point_subsections: list[str], /) -> dict[str, EntryPoint]:
-    return {ep.name: ep for entry_point_category in entry_point_subsections for ep in entry_points(group=f'awx_plugins.{entry_point_category}')}
+    # entry_points() walks the metadata of every installed distribution, so
+    # do it once and select each group from the result
+    all_entry_points = entry_points()
+    return {ep.name: ep for entry_point_category in entry_point_subsections for ep in all_entry_points.select(group=f'awx_plugins.{entry_point_category}')}
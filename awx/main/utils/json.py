@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Ansible, Inc.
+# All Rights Reserved
+
+"""Fast JSON encoding and decoding for hot paths, backed by orjson."""
+
+import json
+
+import orjson
+
+__all__ = ['dumps', 'loads']
+
+
+def dumps(obj, default=None):
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Non-string dict keys are converted to strings, as the stdlib encoder does.
+    orjson refuses a few documents that json.dumps accepts, like integers wider
+    than 64 bits, so those are passed to the stdlib encoder with the same default.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(obj, default=default).encode('utf-8')
+
+
+def loads(data):
+    """
+    Deserialize JSON from bytes or str.
+
+    The stdlib parser also accepts NaN and Infinity, so it has the final say
+    on documents that orjson rejects.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
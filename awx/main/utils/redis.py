@@ -5,6 +5,10 @@
 
 """Redis client utilities with automatic retry on connection errors."""
 
+import functools
+import socket
+from urllib.parse import urlparse
+
 import redis
 import redis.asyncio
 from django.conf import settings
@@ -53,6 +57,43 @@ def get_redis_client():
     return redis.Redis(connection_pool=pool)
 
 
+def _get_redis_keepalive_kwargs(url):
+    """
+    Get connection kwargs that detect dead connections before a command is sent on them.
+
+    TCP keepalive only applies to redis:// and rediss:// URLs, unix socket
+    connections do not accept those options.
+    """
+    kwargs = {'health_check_interval': 30}
+    if urlparse(url).scheme in ('redis', 'rediss'):
+        keepalive_options = {'TCP_KEEPIDLE': 30, 'TCP_KEEPINTVL': 10, 'TCP_KEEPCNT': 3}
+        kwargs['socket_keepalive'] = True
+        kwargs['socket_keepalive_options'] = {getattr(socket, name): value for name, value in keepalive_options.items() if hasattr(socket, name)}
+    return kwargs
+
+
+@functools.cache
+def get_shared_redis_client():
+    """
+    Return a process wide Redis client backed by a single blocking connection pool.
+
+    Unlike get_redis_client(), repeated calls do not open a new pool, so short lived
+    users such as the callback event dispatcher reuse warm connections. redis-py
+    resets the pool after a fork, so the client is safe to share with forked workers.
+
+    Returns:
+        redis.Redis: A Redis client instance configured with retry logic and keepalive
+    """
+    pool = redis.BlockingConnectionPool.from_url(
+        settings.BROKER_URL,
+        max_connections=16,
+        timeout=5,
+        **_get_redis_keepalive_kwargs(settings.BROKER_URL),
+        **_get_redis_pool_kwargs(),
+    )
+    return redis.Redis(connection_pool=pool)
+
+
 def get_redis_client_async():
     """
     Create an async Redis client with automatic retry on connection errors.
@@ -44,6 +44,16 @@ LISTENER_DATABASES = {
     }
 }
 
+# Database overrides for the connection of each dispatcher worker process
+# Workers run many short tasks, so the connection is kept across tasks and
+# checked before reuse rather than reconnecting for every task
+DISPATCHER_WORKER_DATABASES = {
+    'default': {
+        'CONN_MAX_AGE': 300,
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
 # Whether or not the deployment is a K8S-based deployment
 # In K8S-based deployments, instances have zero capacity - all playbook
 # automation is intended to flow through defined Container Groups that
@@ -416,6 +426,11 @@ EXECUTION_NODE_REMEDIATION_CHECKS = 60 * 30  # once every 30 minutes check if an
 # Amount of time dispatcher will try to reconnect to database for jobs and consuming new work
 DISPATCHER_DB_DOWNTIME_TOLERANCE = 40
 
+# Number of dispatcher worker processes kept alive when idle, so the first burst of tasks
+# after a restart does not wait for workers to spawn. If None, it is sized from the
+# CPU count of the node, see get_auto_min_workers. It never exceeds the pool maximum.
+DISPATCHER_MIN_WORKERS = None
+
 # If you set this, nothing will ever be sent to pg_notify
 # this is not practical to use, although periodic schedules may still run slugish but functional tasks
 # sqlite3 based tests will use this
@@ -1072,6 +1087,10 @@ SPECTACULAR_SETTINGS = {
         'Kind362Enum': 'InventoryKindEnum',
     },
 }
+
+# Number of seconds a rendered OpenAPI schema response is cached per client
+API_SCHEMA_CACHE_TIMEOUT = 600
+
 OAUTH2_PROVIDER = {}
 
 # Add a postfix to the API URL patterns